@@ -2,25 +2,37 @@
 Main entry point for PII Detection & Data Quality Validation Pipeline.
 """
 
+import atexit
+import copy
+import functools
 import logging
+import logging.handlers
+import queue
 import sys
 from pathlib import Path
+import pandas as pd
 import yaml
 
 from src.pipeline import DataPipeline
 
+# libyaml's C loader when PyYAML was built with it, pure-Python otherwise
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 def setup_logging(log_dir: str = "logs", log_level: str = "DEBUG"):
-    """Configure logging to file and console."""
+    """Configure logging to file and console.
+    
+    Records are handed to a queue and written by a background listener, so
+    pipeline threads never block on file flushes.
+    """
     log_dir = Path(log_dir)
     log_dir.mkdir(parents=True, exist_ok=True)
     
     log_file = log_dir / "pipeline.log"
     
-    # Root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.DEBUG)
-    
     # File handler (DEBUG and above)
     file_handler = logging.FileHandler(log_file)
     file_handler.setLevel(logging.DEBUG)
@@ -28,7 +40,6 @@ def setup_logging(log_dir: str = "logs", log_level: str = "DEBUG"):
         '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
     )
     file_handler.setFormatter(file_formatter)
-    root_logger.addHandler(file_handler)
     
     # Console handler (INFO and above)
     console_handler = logging.StreamHandler(sys.stdout)
@@ -37,16 +48,37 @@ def setup_logging(log_dir: str = "logs", log_level: str = "DEBUG"):
         '%(asctime)s - %(levelname)s - %(message)s'
     )
     console_handler.setFormatter(console_formatter)
-    root_logger.addHandler(console_handler)
+    
+    # Root logger only enqueues; the listener thread does the I/O
+    log_queue = queue.Queue(-1)
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.DEBUG)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    # Drain the queue before the interpreter exits
+    atexit.register(listener.stop)
     
     logging.info(f"Logging configured: {log_file}")
+    return listener
+
+
+@functools.lru_cache(maxsize=1)
+def _read_config(config_file: str, mtime: float) -> dict:
+    """Parse a YAML config; cached per path and modification time."""
+    with open(config_file, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
 
 
 def load_config(config_file: str = "config/config.yaml") -> dict:
     """Load configuration from YAML file."""
     try:
-        with open(config_file, 'r') as f:
-            config = yaml.safe_load(f)
+        mtime = Path(config_file).stat().st_mtime
+        # Copy so callers can't mutate the cached parse
+        config = copy.deepcopy(_read_config(config_file, mtime))
         logging.info(f"Configuration loaded from {config_file}")
         return config
     except Exception as e:
@@ -62,19 +94,32 @@ def main():
     logger = logging.getLogger(__name__)
     logger.info("Starting PII Detection & Data Quality Validation Pipeline")
     
+    # Copy-on-write lets assign() share untouched columns instead of copying them
+    pd.set_option('mode.copy_on_write', True)
+    
     # Load configuration
     config = load_config("config/config.yaml")
     
     input_csv = config.get('paths', {}).get('input_csv', 'data/customers_raw.csv')
     output_dir = config.get('paths', {}).get('output_dir', 'output')
+    parallel_columns = config.get('cleaning', {}).get('parallel_columns', False)
+    chunksize = config.get('processing', {}).get('chunksize')
+    output_format = config.get('processing', {}).get('output_format', 'csv')
+    parallel_stages = config.get('processing', {}).get('parallel_stages', False)
     
     # Verify input file exists
     if not Path(input_csv).exists():
-        logger.error(f"Input file not found: {input_csv}")
+        logger.error("Input file not found: %s", input_csv)
         return False
     
     # Create and execute pipeline
-    pipeline = DataPipeline(input_csv, output_dir)
+    pipeline = DataPipeline(
+        input_csv, output_dir,
+        parallel_columns=parallel_columns,
+        chunksize=chunksize,
+        output_format=output_format,
+        parallel_stages=parallel_stages
+    )
     success = pipeline.execute()
     
     if success:
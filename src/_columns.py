@@ -0,0 +1,90 @@
+"""
+Column helpers shared by the cleaner, masker and validators.
+"""
+
+import re
+from typing import Callable
+
+import numpy as np
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = None
+
+# String dtype whose .str regex methods always run Python re
+_PYTHON_TEXT = pd.StringDtype('python')
+
+# Values where RE2 (or polars' Rust regex) and re can disagree: non-ASCII
+# text (re's \d, \s and \w are Unicode-aware), the ASCII separators only re
+# counts as \s, and a trailing newline, which re's $ also matches before
+RE2_DIVERGENT = r'[^\x00-\x7f]|[\x0b\x1c-\x1f]|\n$'
+
+
+def map_unique(values: pd.Series, transform: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """Apply a Series transform to the distinct values only and map results back.
+    
+    Low-cardinality columns (dates, statuses) repeat a handful of values over
+    many rows, so the transform runs on K uniques instead of N rows.
+    """
+    codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    transformed = transform(pd.Series(uniques, dtype=values.dtype, name=values.name))
+    result = transformed.take(codes)
+    result.index = values.index
+    return result
+
+
+def by_regex_engine(values: pd.Series, arrow: Callable[[pd.Series], pd.Series],
+                    python: Callable[[pd.Series], pd.Series]) -> pd.Series:
+    """Run a regex transform on Arrow's RE2 kernels wherever that matches re.
+    
+    pandas only reaches the Arrow kernels for pattern strings; compiled
+    patterns fall back to per-element Python re. arrow should use pattern
+    strings and python the compiled patterns; python only sees the values
+    where the two engines could differ.
+    """
+    if getattr(values.dtype, 'storage', None) != 'pyarrow':
+        return python(values)
+    
+    divergent = values.str.contains(RE2_DIVERGENT, regex=True).fillna(False).to_numpy(dtype=bool)
+    if not divergent.any():
+        return arrow(values)
+    
+    result = arrow(values)
+    positions = np.flatnonzero(divergent)
+    result.iloc[positions] = python(values.iloc[positions]).to_numpy()
+    return result
+
+
+def arrow_regex_replace(values: pd.Series, pattern: str, repl: str) -> pd.Series:
+    """str.replace of an Arrow-backed Series, straight on pyarrow.compute.
+    
+    pandas hands replacements with group references (\\1) to Python re even
+    for pattern strings; RE2 supports them natively.
+    """
+    result = pc.replace_substring_regex(pa.array(values.array), pattern=pattern, replacement=repl)
+    return pd.Series(pd.arrays.ArrowStringArray(result), index=values.index, name=values.name)
+
+
+def regex_replace(values: pd.Series, pattern: re.Pattern, repl: str) -> pd.Series:
+    """values.str.replace(pattern, repl), on Arrow kernels where possible."""
+    return by_regex_engine(
+        values,
+        lambda text: arrow_regex_replace(text, pattern.pattern, repl),
+        lambda text: text.str.replace(pattern, repl, regex=True),
+    )
+
+
+def regex_test(values: pd.Series, method: str, pattern: re.Pattern) -> pd.Series:
+    """values.str.<method>(pattern) for 'contains', 'match' or 'fullmatch', with re's semantics.
+    
+    Arrow-backed strings hand even compiled patterns to RE2, whose \\d is
+    ASCII-only; the values where that could matter are re-checked with re.
+    """
+    return by_regex_engine(
+        values,
+        lambda text: getattr(text.str, method)(pattern.pattern),
+        lambda text: getattr(text.astype(_PYTHON_TEXT).str, method)(pattern),
+    )
@@ -0,0 +1,11 @@
+"""
+Shared dtypes: Arrow-backed strings when pyarrow is available.
+"""
+
+import pandas as pd
+
+try:
+    TEXT_DTYPE = pd.StringDtype('pyarrow')
+except ImportError:
+    # pyarrow missing or too old: fall back to pandas' Python-backed strings
+    TEXT_DTYPE = pd.StringDtype('python')
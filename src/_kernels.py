@@ -0,0 +1,69 @@
+"""
+Kernels: Numba-compiled helpers for scalar hot paths (optional dependency).
+"""
+
+import numpy as np
+
+try:
+    from numba import njit, types
+except ImportError:
+    njit = None
+
+_DASH = 45   # ord('-')
+_ZERO = 48   # ord('0')
+_NINE = 57   # ord('9')
+_NON_ASCII = 128
+
+
+if njit is not None:
+    # Signature at decoration time so the kernel compiles on import, not on first call
+    @njit(types.uint8[::1](types.Array(types.uint8, 1, 'C', readonly=True)), cache=True)
+    def format_phone_bytes(buf):
+        """Format the last ten ASCII digits of buf as XXX-XXX-XXXX.
+        
+        Returns an empty array when buf holds fewer than ten digits.
+        """
+        digits = np.empty(10, dtype=np.uint8)
+        count = 0
+        for ch in buf:
+            if _ZERO <= ch <= _NINE:
+                # Ring buffer keeps only the last ten digits
+                digits[count % 10] = ch
+                count += 1
+        
+        if count < 10:
+            return np.empty(0, dtype=np.uint8)
+        
+        out = np.empty(12, dtype=np.uint8)
+        pos = 0
+        for i in range(10):
+            if i == 3 or i == 6:
+                out[pos] = _DASH
+                pos += 1
+            out[pos] = digits[(count + i) % 10]
+            pos += 1
+        return out
+    
+    @njit(types.int64[::1](types.Array(types.int64, 1, 'C', readonly=True),
+                           types.Array(types.uint8, 1, 'C', readonly=True)), cache=True)
+    def count_digits_batch(offsets, data):
+        """Count the ASCII digits of each string in an Arrow-style buffer pair.
+        
+        String i spans data[offsets[i]:offsets[i + 1]]. Strings holding any
+        non-ASCII byte get -1 so the caller can count their Unicode digits.
+        """
+        counts = np.zeros(len(offsets) - 1, dtype=np.int64)
+        for i in range(len(counts)):
+            count = 0
+            for pos in range(offsets[i], offsets[i + 1]):
+                ch = data[pos]
+                if ch >= _NON_ASCII:
+                    count = -1
+                    break
+                if _ZERO <= ch <= _NINE:
+                    count += 1
+            counts[i] = count
+        return counts
+else:
+    format_phone_bytes = None
+    count_digits_batch = None
@@ -7,8 +7,24 @@ import logging
 import re
 from typing import Dict
 
+from src._columns import arrow_regex_replace, by_regex_engine, map_unique, regex_replace, regex_test
+from src._dtypes import TEXT_DTYPE
+
 logger = logging.getLogger(__name__)
 
+# PII columns mask_dataframe transforms as text
+TEXT_COLUMNS = ['first_name', 'last_name', 'email', 'phone', 'date_of_birth']
+
+MASKED_ADDRESS = '[MASKED ADDRESS]'
+
+_NONDIGIT = re.compile(r'\D')
+_YYYY_PREFIX = re.compile(r'^\d{4}-')
+_WHITESPACE_RUN = re.compile(r'\s+')
+_NAME_PART = re.compile(r'(\S)\S+')
+_NAME_INITIAL = re.compile(r'(?<!\S)\S(?!\S)')
+_EMAIL_LONG_LOCAL = re.compile(r'^([^@])[^@]+@')
+_EMAIL_SHORT_LOCAL = re.compile(r'^[^@]?@')
+
 
 class PIIMasker:
     """Masks personally identifiable information in dataframe."""
@@ -55,7 +71,7 @@ class PIIMasker:
             return '[UNKNOWN]'
         
         phone = str(phone).strip()
-        digits = re.sub(r'\D', '', phone)
+        digits = _NONDIGIT.sub('', phone)
         
         if len(digits) >= 4:
             last_four = digits[-4:]
@@ -64,11 +80,8 @@ class PIIMasker:
         return "***-***-****"
     
     def mask_address(self, address: str) -> str:
-        """Mask address: 123 Main St → [MASKED ADDRESS]"""
-        if pd.isna(address) or not address or str(address).strip() == '' or str(address).lower() == '[unknown]':
-            return '[MASKED ADDRESS]'
-        
-        return '[MASKED ADDRESS]'
+        """Mask address: 123 Main St → [MASKED ADDRESS] (any input, including missing)"""
+        return MASKED_ADDRESS
     
     def mask_dob(self, dob: str) -> str:
         """Mask DOB: 1985-03-15 → 1985-**-**"""
@@ -77,35 +90,87 @@ class PIIMasker:
         
         dob = str(dob).strip()
         
-        # Extract year if in YYYY-MM-DD format
-        if re.match(r'^\d{4}-', dob):
+        # Extract year if in YYYY-MM-DD format (cheap separator check first)
+        if dob[4:5] == '-' and _YYYY_PREFIX.match(dob):
             year = dob[:4]
             return f"{year}-**-**"
         
         # For other formats, just mask
         return '****-**-**'
     
+    @staticmethod
+    def _unknown_mask(text: pd.Series) -> pd.Series:
+        """Flag missing, blank or already-[UNKNOWN] values in a string Series."""
+        return text.isna() | (text.str.strip() == '') | (text.str.lower() == '[unknown]')
+    
+    def _mask_column_name(self, names: pd.Series) -> pd.Series:
+        """Vectorized mask_name over a whole column."""
+        text = names.astype(TEXT_DTYPE)
+        masked = by_regex_engine(text.str.strip(), self._mask_name_parts_arrow, self._mask_name_parts)
+        return masked.mask(self._unknown_mask(text), '[UNKNOWN]')
+    
+    @staticmethod
+    def _mask_name_parts(names: pd.Series) -> pd.Series:
+        """Mask each whitespace-separated part of stripped names with re."""
+        return (names.str.replace(_WHITESPACE_RUN, ' ', regex=True)
+                .str.replace(_NAME_PART, r'\1***', regex=True)
+                .str.replace(_NAME_INITIAL, '*', regex=True))
+    
+    @staticmethod
+    def _mask_name_parts_arrow(names: pd.Series) -> pd.Series:
+        """_mask_name_parts on Arrow's RE2 kernels.
+        
+        RE2 has no lookarounds for _NAME_INITIAL, so parts are padded to two
+        spaces apart and single-character parts matched with their spaces.
+        """
+        parts = arrow_regex_replace(arrow_regex_replace(names, _WHITESPACE_RUN.pattern, ' '),
+                                    _NAME_PART.pattern, r'\1***')
+        padded = ' ' + parts.str.replace(' ', '  ', regex=False) + ' '
+        return (arrow_regex_replace(padded, r' \S ', ' * ')
+                .str.slice(1, -1)
+                .str.replace('  ', ' ', regex=False))
+    
+    def _mask_column_email(self, emails: pd.Series) -> pd.Series:
+        """Vectorized mask_email over a whole column."""
+        text = emails.astype(TEXT_DTYPE)
+        # Local parts longer than one character keep their first letter,
+        # shorter ones collapse to '*'; values without '@' pass through
+        masked = regex_replace(regex_replace(text.str.strip().str.lower(), _EMAIL_LONG_LOCAL, r'\1***@'),
+                               _EMAIL_SHORT_LOCAL, '*@')
+        return masked.mask(self._unknown_mask(text), '[UNKNOWN]')
+    
+    def _mask_column_phone(self, phones: pd.Series) -> pd.Series:
+        """Vectorized mask_phone over a whole column."""
+        text = phones.astype(TEXT_DTYPE)
+        digits = regex_replace(text, _NONDIGIT, '')
+        masked = ('***-***-' + digits.str[-4:]).where(digits.str.len() >= 4, '***-***-****')
+        return masked.mask(self._unknown_mask(text), '[UNKNOWN]')
+    
+    def _mask_column_dob(self, dobs: pd.Series) -> pd.Series:
+        """Vectorized mask_dob over a whole column."""
+        text = dobs.astype(TEXT_DTYPE)
+        dob = text.str.strip()
+        has_year = regex_test(dob, 'match', _YYYY_PREFIX).fillna(False).astype(bool)
+        masked = (dob.str[:4] + '-**-**').where(has_year, '****-**-**')
+        return masked.mask(self._unknown_mask(text), '[UNKNOWN]')
+    
     def mask_dataframe(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply masking to all PII columns in dataframe."""
-        logger.info(f"Masking PII in {len(df)} rows...")
-        
-        masked_df = df.copy()
-        
-        # Mask names
-        masked_df['first_name'] = masked_df['first_name'].apply(self.mask_name)
-        masked_df['last_name'] = masked_df['last_name'].apply(self.mask_name)
-        
-        # Mask email
-        masked_df['email'] = masked_df['email'].apply(self.mask_email)
-        
-        # Mask phone
-        masked_df['phone'] = masked_df['phone'].apply(self.mask_phone)
-        
-        # Mask address
-        masked_df['address'] = masked_df['address'].apply(self.mask_address)
-        
-        # Mask DOB
-        masked_df['date_of_birth'] = masked_df['date_of_birth'].apply(self.mask_dob)
+        logger.info("Masking PII in %d rows...", len(df))
+        
+        text = df[TEXT_COLUMNS].astype(TEXT_DTYPE)
+        
+        # Every touched column is replaced, so build a new frame with assign
+        # rather than copying all of df up front
+        masked_df = df.assign(
+            first_name=self._mask_column_name(text['first_name']),
+            last_name=self._mask_column_name(text['last_name']),
+            email=self._mask_column_email(text['email']),
+            phone=self._mask_column_phone(text['phone']),
+            address=MASKED_ADDRESS,
+            # Birth dates repeat heavily, so mask each distinct value once
+            date_of_birth=map_unique(text['date_of_birth'], self._mask_column_dob)
+        )
         
         logger.info("PII masking complete")
         
@@ -118,13 +183,8 @@ class PIIMasker:
             "-" * 80
         ]
         
-        # Show original header and rows
-        lines.append(",".join(original_df.columns))
-        
-        for idx in range(min(num_rows, len(original_df))):
-            row = original_df.iloc[idx]
-            row_str = ",".join([str(val) for val in row.values])
-            lines.append(row_str)
+        # Show original header and rows (to_csv handles quoting)
+        lines.append(original_df.head(num_rows).to_csv(index=False, lineterminator='\n').rstrip('\n'))
         
         lines.extend([
             "",
@@ -133,12 +193,7 @@ class PIIMasker:
         ])
         
         # Show masked header and rows
-        lines.append(",".join(masked_df.columns))
-        
-        for idx in range(min(num_rows, len(masked_df))):
-            row = masked_df.iloc[idx]
-            row_str = ",".join([str(val) for val in row.values])
-            lines.append(row_str)
+        lines.append(masked_df.head(num_rows).to_csv(index=False, lineterminator='\n').rstrip('\n'))
         
         lines.extend([
             "",
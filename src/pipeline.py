@@ -4,30 +4,183 @@ Pipeline: Orchestrates end-to-end data processing workflow.
 
 import pandas as pd
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Tuple
+from typing import Callable, Dict, List, Optional, Tuple
 
 from src.profiler import DataProfiler
 from src.validators import DataValidator, PIIDetector
 from src.cleaner import DataCleaner
 from src.masker import PIIMasker
+from src._dtypes import TEXT_DTYPE
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Characters that make DataFrame.to_csv quote a field
+_CSV_SPECIAL_RE = r'[,"\r\n]'
 
 logger = logging.getLogger(__name__)
 
+# Larger file buffers mean fewer read/write syscalls when streaming chunks
+IO_BUFFER_SIZE = 1 << 20
+
+DELIVERABLES = [
+    "[OK] data_quality_report.txt - Data profiling results",
+    "[OK] validation_results.txt - Validation outcomes",
+    "[OK] cleaning_log.txt - Cleaning actions applied",
+    "[OK] pii_detection_report.txt - PII exposure analysis",
+    "[OK] masked_sample.txt - Before/after comparison",
+    "[OK] customers_cleaned.{ext} - Cleaned dataset",
+    "[OK] customers_masked.{ext} - Masked dataset",
+    "[OK] pipeline_execution_report.txt - This report",
+]
+
+OUTPUT_FORMATS = ('csv', 'parquet')
+
+EMPTY_INPUT_DELIVERABLES = [
+    "[OK] pipeline_execution_report.txt - This report",
+]
+
+STREAMING_DELIVERABLES = [
+    "[OK] cleaning_log.txt - Cleaning actions applied",
+    "[OK] customers_cleaned.{ext} - Cleaned dataset",
+    "[OK] customers_masked.{ext} - Masked dataset",
+    "[OK] pipeline_execution_report.txt - This report",
+]
+
+
+def _unquoted_csv_text(df: pd.DataFrame) -> Optional[pd.DataFrame]:
+    """df with Arrow-backed text if to_csv would write it without any quoting, else None.
+    
+    Only text and integer columns qualify, since pyarrow formats those
+    exactly as pandas does.
+    """
+    if pa is None or len(df.columns) < 2:
+        # A lone empty field is quoted by the csv module
+        return None
+    if any(ch in str(name) for name in df.columns for ch in ',"\r\n'):
+        return None
+    
+    text_cols = {}
+    for col in df.columns:
+        if pd.api.types.is_integer_dtype(df[col]):
+            continue
+        if not pd.api.types.is_string_dtype(df[col]):
+            return None
+        values = df[col].astype(TEXT_DTYPE)
+        if values.str.contains(_CSV_SPECIAL_RE, regex=True).any():
+            return None
+        text_cols[col] = TEXT_DTYPE
+    return df.astype(text_cols)
+
+
+class _DatasetWriter:
+    """Writes DataFrame chunks to one CSV or Parquet dataset file.
+    
+    Parquet goes through pyarrow's writer. CSV output is byte-identical to
+    DataFrame.to_csv: chunks of plain text that need no quoting are written
+    by pyarrow's CSV writer, anything else by pandas.
+    """
+    
+    def __init__(self, path: Path, output_format: str):
+        self.path = path
+        self.output_format = output_format
+        self._handle = None
+        self._arrow_writer = None
+        self._schema = None
+    
+    def write(self, df: pd.DataFrame):
+        """Append a chunk; the first chunk writes the CSV header / Parquet schema."""
+        if self.output_format == 'csv':
+            self._write_csv(df)
+            return
+        
+        # Store text as strings so all-missing chunks keep the same schema
+        text_cols = {col: TEXT_DTYPE for col in df.columns if df[col].dtype == object}
+        table = pa.Table.from_pandas(df.astype(text_cols), preserve_index=False)
+        if self._arrow_writer is None:
+            self._schema = table.schema
+            self._arrow_writer = pq.ParquetWriter(self.path, self._schema, compression='zstd')
+        self._arrow_writer.write_table(table.cast(self._schema))
+    
+    def _write_csv(self, df: pd.DataFrame):
+        """Append a CSV chunk through pyarrow when it gives pandas' exact bytes."""
+        first = self._handle is None
+        if first:
+            self._handle = open(self.path, 'wb', buffering=IO_BUFFER_SIZE)
+        
+        text = _unquoted_csv_text(df)
+        if text is None:
+            df.to_csv(self._handle, header=first, index=False, encoding='utf-8')
+        else:
+            options = pacsv.WriteOptions(include_header=first, quoting_style='none', quoting_header='none',
+                                         eol=os.linesep)
+            pacsv.write_csv(pa.Table.from_pandas(text, preserve_index=False), self._handle, options)
+    
+    def close(self):
+        """Flush and close the underlying file."""
+        if self._arrow_writer is not None:
+            self._arrow_writer.close()
+        if self._handle is not None:
+            self._handle.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+
 
 class DataPipeline:
     """End-to-end data governance pipeline."""
     
-    def __init__(self, input_csv: str, output_dir: str):
-        """Initialize pipeline."""
+    def __init__(
+        self,
+        input_csv: str,
+        output_dir: str,
+        parallel_columns: bool = False,
+        chunksize: Optional[int] = None,
+        output_format: str = 'csv',
+        parallel_stages: bool = False
+    ):
+        """Initialize pipeline.
+        
+        With chunksize set, execute() streams the input through cleaning and
+        masking chunk by chunk instead of loading it whole. output_format
+        selects CSV or Parquet (pyarrow, zstd) for the two dataset files.
+        parallel_stages runs the read-only stage pairs (profile + validate raw,
+        validate cleaned + detect PII) on two threads.
+        """
+        if output_format not in OUTPUT_FORMATS:
+            raise ValueError(f"output_format must be one of {OUTPUT_FORMATS}, got {output_format!r}")
+        if output_format == 'parquet' and pa is None:
+            raise ImportError("output_format='parquet' requires the pyarrow package")
+        
         self.input_csv = input_csv
         self.output_dir = Path(output_dir)
+        self.parallel_columns = parallel_columns
+        self.chunksize = chunksize
+        self.output_format = output_format
+        self.parallel_stages = parallel_stages
         self.output_dir.mkdir(parents=True, exist_ok=True)
         
         self.execution_log = []
         self.start_time = datetime.now()
         
+        # One instance of each stage worker for the pipeline's lifetime
+        self._cleaner = DataCleaner(parallel_columns=parallel_columns)
+        self._validator = DataValidator()
+        self._detector = PIIDetector()
+        self._masker = PIIMasker()
+        
         logger.info("Initialized pipeline: %s -> %s", input_csv, output_dir)
     
     def log_stage(self, stage: str, status: str, details: str = ""):
@@ -46,13 +199,13 @@ class DataPipeline:
         logger.info("=" * 60)
         
         try:
-            df = pd.read_csv(self.input_csv, dtype=str)
+            df = pd.read_csv(self.input_csv, dtype=TEXT_DTYPE)
             self.log_stage("LOAD", "✓ SUCCESS", f"({len(df)} rows, {len(df.columns)} columns)")
-            logger.info(f"Columns: {list(df.columns)}")
+            logger.info("Columns: %s", list(df.columns))
             return df, True
         except Exception as e:
             self.log_stage("LOAD", "FAILED", str(e))
-            logger.error(f"Failed to load: {e}")
+            logger.error("Failed to load: %s", e)
             return None, False
     
     def stage_2_profile(self, df: pd.DataFrame) -> Tuple[str, bool]:
@@ -62,8 +215,7 @@ class DataPipeline:
         logger.info("=" * 60)
         
         try:
-            profiler = DataProfiler(self.input_csv)
-            profiler.df = df
+            profiler = DataProfiler(df=df)
             report = profiler.generate_report(self.output_dir / "data_quality_report.txt")
             
             self.log_stage("PROFILE", "OK", "quality report generated")
@@ -72,7 +224,7 @@ class DataPipeline:
             return report, True
         except Exception as e:
             self.log_stage("PROFILE", "FAILED", str(e))
-            logger.error(f"Profiling failed: {e}")
+            logger.error("Profiling failed: %s", e)
             return "", False
     
     def stage_3_validate_raw(self, df: pd.DataFrame) -> Tuple[Dict, bool]:
@@ -82,8 +234,7 @@ class DataPipeline:
         logger.info("=" * 60)
         
         try:
-            validator = DataValidator()
-            validation_details = validator.validate_with_details(df, is_cleaned=False)
+            validation_details = self._validator.validate_with_details(df, is_cleaned=False)
             
             passed = validation_details['passed_rows']
             failed = validation_details['failed_rows']
@@ -94,12 +245,12 @@ class DataPipeline:
                 f"({passed} passed, {len(failed)} issues)"
             )
             
-            logger.info(f"Validation result: {passed}/{len(df)} rows passed")
+            logger.info("Validation result: %s/%d rows passed", passed, len(df))
             
             return validation_details, True
         except Exception as e:
             self.log_stage("VALIDATE_RAW", "FAILED", str(e))
-            logger.error(f"Validation failed: {e}")
+            logger.error("Validation failed: %s", e)
             return {}, False
     
     def stage_4_clean(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict, bool]:
@@ -109,8 +260,7 @@ class DataPipeline:
         logger.info("=" * 60)
         
         try:
-            cleaner = DataCleaner()
-            cleaned_df, stats = cleaner.clean_data(df)
+            cleaned_df, stats = self._cleaner.clean_data(df)
             
             self.log_stage(
                 "CLEAN",
@@ -118,12 +268,12 @@ class DataPipeline:
                 f"({stats['rows_remaining']} rows)"
             )
             
-            logger.info(f"Cleaning stats: {stats}")
+            logger.info("Cleaning stats: %s", stats)
             
             return cleaned_df, stats, True
         except Exception as e:
             self.log_stage("CLEAN", "FAILED", str(e))
-            logger.error(f"Cleaning failed: {e}")
+            logger.error("Cleaning failed: %s", e)
             return None, {}, False
     
     def stage_5_validate_clean(self, df: pd.DataFrame) -> Tuple[Dict, bool]:
@@ -133,8 +283,7 @@ class DataPipeline:
         logger.info("=" * 60)
         
         try:
-            validator = DataValidator()
-            validation_details = validator.validate_with_details(df, is_cleaned=True)
+            validation_details = self._validator.validate_with_details(df, is_cleaned=True)
             
             passed = validation_details['passed_rows']
             failed = validation_details['failed_rows']
@@ -150,7 +299,7 @@ class DataPipeline:
             return validation_details, True
         except Exception as e:
             self.log_stage("VALIDATE_CLEAN", "FAILED", str(e))
-            logger.error(f"Validation failed: {e}")
+            logger.error("Validation failed: %s", e)
             return {}, False
     
     def stage_6_detect_pii(self, df: pd.DataFrame) -> Tuple[Dict, Dict, bool]:
@@ -160,9 +309,8 @@ class DataPipeline:
         logger.info("=" * 60)
         
         try:
-            detector = PIIDetector()
-            pii_data = detector.detect_pii(df)
-            risk = detector.calculate_exposure_risk(df, pii_data)
+            pii_data = self._detector.detect_pii(df)
+            risk = self._detector.calculate_exposure_risk(df, pii_data)
             
             self.log_stage(
                 "DETECT_PII",
@@ -170,12 +318,12 @@ class DataPipeline:
                 f"({len(pii_data['emails'])} emails, {len(pii_data['phones'])} phones)"
             )
             
-            logger.info(f"PII exposure: {risk}")
+            logger.info("PII exposure: %s", risk)
             
             return pii_data, risk, True
         except Exception as e:
             self.log_stage("DETECT_PII", "FAILED", str(e))
-            logger.error(f"PII detection failed: {e}")
+            logger.error("PII detection failed: %s", e)
             return {}, {}, False
     
     def stage_7_mask(self, cleaned_df: pd.DataFrame) -> Tuple[pd.DataFrame, str, bool]:
@@ -185,9 +333,8 @@ class DataPipeline:
         logger.info("=" * 60)
         
         try:
-            masker = PIIMasker()
-            masked_df = masker.mask_dataframe(cleaned_df)
-            sample_report = masker.generate_masked_sample(cleaned_df, masked_df)
+            masked_df = self._masker.mask_dataframe(cleaned_df)
+            sample_report = self._masker.generate_masked_sample(cleaned_df, masked_df)
             
             self.log_stage(
                 "MASK",
@@ -198,7 +345,7 @@ class DataPipeline:
             return masked_df, sample_report, True
         except Exception as e:
             self.log_stage("MASK", "FAILED", str(e))
-            logger.error(f"Masking failed: {e}")
+            logger.error("Masking failed: %s", e)
             return None, "", False
     
     def stage_8_save_outputs(
@@ -219,62 +366,51 @@ class DataPipeline:
         logger.info("=" * 60)
         
         try:
-            # Save cleaned CSV
-            cleaned_csv = self.output_dir / "customers_cleaned.csv"
-            cleaned_df.to_csv(cleaned_csv, index=False)
-            logger.info(f"Saved: {cleaned_csv}")
-            
-            # Save masked CSV
-            masked_csv = self.output_dir / "customers_masked.csv"
-            masked_df.to_csv(masked_csv, index=False)
-            logger.info(f"Saved: {masked_csv}")
+            cleaned_file = self._dataset_path("customers_cleaned")
+            masked_file = self._dataset_path("customers_masked")
             
-            # Save validation results
-            validation_report = self._generate_validation_report(validation_raw, validation_clean)
-            validation_file = self.output_dir / "validation_results.txt"
-            with open(validation_file, 'w', encoding='utf-8') as f:
-                f.write(validation_report)
-            logger.info(f"Saved: {validation_file}")
+            text_outputs = {
+                "validation_results.txt": self._generate_validation_report(validation_raw, validation_clean),
+                "cleaning_log.txt": self._cleaner.generate_cleaning_log(cleaning_stats, cleaned_file.name),
+                "pii_detection_report.txt": self._generate_pii_report(pii_data, pii_risk),
+                "masked_sample.txt": masked_sample,
+            }
             
-            # Save cleaning log
-            cleaner = DataCleaner()
-            cleaning_log = cleaner.generate_cleaning_log(cleaning_stats)
-            cleaning_file = self.output_dir / "cleaning_log.txt"
-            with open(cleaning_file, 'w', encoding='utf-8') as f:
-                f.write(cleaning_log)
-            logger.info(f"Saved: {cleaning_file}")
-            
-            # Save PII detection report
-            pii_report = self._generate_pii_report(pii_data, pii_risk)
-            pii_file = self.output_dir / "pii_detection_report.txt"
-            with open(pii_file, 'w', encoding='utf-8') as f:
-                f.write(pii_report)
-            logger.info(f"Saved: {pii_file}")
-            
-            # Save masked sample
-            masked_file = self.output_dir / "masked_sample.txt"
-            with open(masked_file, 'w', encoding='utf-8') as f:
-                f.write(masked_sample)
-            logger.info(f"Saved: {masked_file}")
+            # The writes are independent and IO-bound, so overlap them on threads
+            with ThreadPoolExecutor(max_workers=4) as executor:
+                futures = {
+                    cleaned_file: executor.submit(self._write_dataset, cleaned_file, cleaned_df),
+                    masked_file: executor.submit(self._write_dataset, masked_file, masked_df),
+                }
+                for name, text in text_outputs.items():
+                    path = self.output_dir / name
+                    futures[path] = executor.submit(path.write_text, text, encoding='utf-8')
+                
+                for path, future in futures.items():
+                    future.result()
+                    logger.info("Saved: %s", path)
             
             # Profile report already saved
-            logger.info(f"Verified: data_quality_report.txt")
+            logger.info("Verified: data_quality_report.txt")
             
             self.log_stage("SAVE", "OK", "(all outputs saved)")
             
             return True
         except Exception as e:
             self.log_stage("SAVE", "FAILED", str(e))
-            logger.error(f"Save failed: {e}")
+            logger.error("Save failed: %s", e)
             return False
     
     def execute(self) -> bool:
         """Execute full pipeline."""
+        if self.chunksize:
+            return self.execute_streaming()
+        
         logger.info("\n\n")
         logger.info("=" * 60)
         logger.info("PII DETECTION & DATA QUALITY PIPELINE")
         logger.info("=" * 60)
-        logger.info(f"Start Time: {self.start_time.isoformat()}")
+        logger.info("Start Time: %s", self.start_time.isoformat())
         logger.info("=" * 60)
         
         # Stage 1: Load
@@ -282,30 +418,35 @@ class DataPipeline:
         if not success:
             return False
         
-        # Stage 2: Profile
-        profile_report, success = self.stage_2_profile(df)
-        if not success:
-            return False
+        # Nothing to profile, clean or mask: report and stop
+        if len(df) == 0:
+            self.log_stage("SKIP", "OK", "(input has no rows; stages 2-8 skipped)")
+            self._save_execution_report(EMPTY_INPUT_DELIVERABLES)
+            self._log_completion()
+            return True
         
-        # Stage 3: Validate Raw
-        validation_raw, success = self.stage_3_validate_raw(df)
+        # Stages 2-3: Profile and Validate Raw (both only read df)
+        results, success = self._run_independent_stages(
+            partial(self.stage_2_profile, df),
+            partial(self.stage_3_validate_raw, df)
+        )
         if not success:
             return False
+        (profile_report, _), (validation_raw, _) = results
         
         # Stage 4: Clean
         cleaned_df, cleaning_stats, success = self.stage_4_clean(df)
         if not success:
             return False
         
-        # Stage 5: Validate Cleaned
-        validation_clean, success = self.stage_5_validate_clean(cleaned_df)
-        if not success:
-            return False
-        
-        # Stage 6: Detect PII
-        pii_data, pii_risk, success = self.stage_6_detect_pii(cleaned_df)
+        # Stages 5-6: Validate Cleaned and Detect PII (both only read cleaned_df)
+        results, success = self._run_independent_stages(
+            partial(self.stage_5_validate_clean, cleaned_df),
+            partial(self.stage_6_detect_pii, cleaned_df)
+        )
         if not success:
             return False
+        (validation_clean, _), (pii_data, pii_risk, _) = results
         
         # Stage 7: Mask
         masked_df, masked_sample, success = self.stage_7_mask(cleaned_df)
@@ -323,25 +464,130 @@ class DataPipeline:
             return False
         
         # Generate execution report
-        execution_report = self._generate_execution_report()
+        self._save_execution_report(DELIVERABLES)
+        self._log_completion()
+        
+        return True
+    
+    def execute_streaming(self) -> bool:
+        """Clean and mask the input in chunks, appending each to the output CSVs.
+        
+        Memory stays bounded by the chunk size. Profiling, validation and PII
+        reports need the whole dataset, so they are skipped in this mode.
+        """
+        logger.info("\n\n")
+        logger.info("=" * 60)
+        logger.info("PII DETECTION & DATA QUALITY PIPELINE (STREAMING)")
+        logger.info("=" * 60)
+        logger.info("Start Time: %s", self.start_time.isoformat())
+        logger.info("Chunk size: %s rows", self.chunksize)
+        logger.info("=" * 60)
+        
+        cleaned_file = self._dataset_path("customers_cleaned")
+        masked_file = self._dataset_path("customers_masked")
+        cleaning_stats = {
+            'rows_processed': 0,
+            'rows_dropped': 0,
+            'rows_remaining': 0,
+            'normalization_actions': {},
+            'missing_value_actions': {}
+        }
+        
+        try:
+            with open(self.input_csv, 'rb', buffering=IO_BUFFER_SIZE) as source, \
+                 _DatasetWriter(cleaned_file, self.output_format) as cleaned_out, \
+                 _DatasetWriter(masked_file, self.output_format) as masked_out:
+                chunks = pd.read_csv(source, dtype=TEXT_DTYPE, chunksize=self.chunksize)
+                for chunk_num, chunk in enumerate(chunks):
+                    cleaned_chunk, stats = self._cleaner.clean_data(chunk)
+                    masked_chunk = self._masker.mask_dataframe(cleaned_chunk)
+                    
+                    cleaned_out.write(cleaned_chunk)
+                    masked_out.write(masked_chunk)
+                    self._merge_cleaning_stats(cleaning_stats, stats)
+                    
+                    logger.info("Chunk %s: %d rows in, %d rows out",
+                                chunk_num + 1, len(chunk), len(cleaned_chunk))
+            
+            self.log_stage(
+                "STREAM",
+                "OK",
+                f"({cleaning_stats['rows_processed']} rows in, {cleaning_stats['rows_remaining']} rows out)"
+            )
+            logger.info("Saved: %s", cleaned_file)
+            logger.info("Saved: %s", masked_file)
+            
+            cleaning_file = self.output_dir / "cleaning_log.txt"
+            with open(cleaning_file, 'w', encoding='utf-8') as f:
+                f.write(self._cleaner.generate_cleaning_log(cleaning_stats, cleaned_file.name))
+            logger.info("Saved: %s", cleaning_file)
+        except Exception as e:
+            self.log_stage("STREAM", "FAILED", str(e))
+            logger.error("Streaming failed: %s", e)
+            return False
+        
+        self._save_execution_report(STREAMING_DELIVERABLES)
+        self._log_completion()
+        
+        return True
+    
+    def _run_independent_stages(self, *stages: Callable[[], Tuple]) -> Tuple[List[Tuple], bool]:
+        """Run stages that don't depend on each other, on threads if parallel_stages is set.
+        
+        Each stage returns a tuple ending in its success flag. Run serially,
+        the remaining stages are skipped after the first failure.
+        """
+        if self.parallel_stages:
+            with ThreadPoolExecutor(max_workers=len(stages)) as executor:
+                futures = [executor.submit(stage) for stage in stages]
+                results = [future.result() for future in futures]
+            return results, all(result[-1] for result in results)
+        
+        results = []
+        for stage in stages:
+            results.append(stage())
+            if not results[-1][-1]:
+                return results, False
+        return results, True
+    
+    @staticmethod
+    def _merge_cleaning_stats(total: Dict, stats: Dict):
+        """Accumulate one chunk's cleaning stats into the running totals."""
+        for key in ('rows_processed', 'rows_dropped', 'rows_remaining'):
+            total[key] += stats[key]
+        for action, count in stats['normalization_actions'].items():
+            total['normalization_actions'][action] = total['normalization_actions'].get(action, 0) + count
+    
+    def _write_dataset(self, path: Path, df: pd.DataFrame):
+        """Write a whole DataFrame as one dataset file."""
+        with _DatasetWriter(path, self.output_format) as writer:
+            writer.write(df)
+    
+    def _dataset_path(self, stem: str) -> Path:
+        """Output path for a dataset file in the configured format."""
+        return self.output_dir / f"{stem}.{self.output_format}"
+    
+    def _save_execution_report(self, deliverables: List[str]):
+        """Write the execution report listing the given deliverables."""
+        execution_report = self._generate_execution_report(deliverables)
         report_file = self.output_dir / "pipeline_execution_report.txt"
         with open(report_file, 'w', encoding='utf-8') as f:
             f.write(execution_report)
-        logger.info(f"Saved: {report_file}")
-        
+        logger.info("Saved: %s", report_file)
+    
+    def _log_completion(self):
+        """Log the end-of-run summary."""
         end_time = datetime.now()
         duration = (end_time - self.start_time).total_seconds()
         
         logger.info("\n" + "=" * 60)
         logger.info("PIPELINE EXECUTION COMPLETE")
         logger.info("=" * 60)
-        logger.info(f"Start: {self.start_time.isoformat()}")
-        logger.info(f"End: {end_time.isoformat()}")
-        logger.info(f"Duration: {duration:.2f} seconds")
-        logger.info(f"Status: SUCCESS")
+        logger.info("Start: %s", self.start_time.isoformat())
+        logger.info("End: %s", end_time.isoformat())
+        logger.info("Duration: %.2f seconds", duration)
+        logger.info("Status: SUCCESS")
         logger.info("=" * 60 + "\n")
-        
-        return True
     
     def _generate_validation_report(self, validation_raw: Dict, validation_clean: Dict) -> str:
         """Generate validation results report."""
@@ -362,8 +608,10 @@ class DataPipeline:
                 "",
                 "Issues found in raw data:",
             ])
-            for item in validation_raw['failed_rows'][:10]:
-                lines.append(f"  Row {item['row_number']}: {', '.join(item['issues'])}")
+            lines.extend(
+                f"  Row {item['row_number']}: {', '.join(item['issues'])}"
+                for item in validation_raw['failed_rows'][:10]
+            )
         
         lines.extend([
             "",
@@ -380,8 +628,10 @@ class DataPipeline:
                 "",
                 "Issues remaining after cleaning:",
             ])
-            for item in validation_clean['failed_rows'][:10]:
-                lines.append(f"  Row {item['row_number']}: {', '.join(item['issues'])}")
+            lines.extend(
+                f"  Row {item['row_number']}: {', '.join(item['issues'])}"
+                for item in validation_clean['failed_rows'][:10]
+            )
         else:
             lines.append("✓ All data validated successfully!")
         
@@ -422,7 +672,7 @@ class DataPipeline:
         
         return "\n".join(lines)
     
-    def _generate_execution_report(self) -> str:
+    def _generate_execution_report(self, deliverables: List[str] = DELIVERABLES) -> str:
         """Generate execution summary report."""
         lines = [
             "PIPELINE EXECUTION REPORT",
@@ -438,14 +688,7 @@ class DataPipeline:
             "",
             "DELIVERABLES CREATED:",
             "-" * 40,
-            "[OK] data_quality_report.txt - Data profiling results",
-            "[OK] validation_results.txt - Validation outcomes",
-            "[OK] cleaning_log.txt - Cleaning actions applied",
-            "[OK] pii_detection_report.txt - PII exposure analysis",
-            "[OK] masked_sample.txt - Before/after comparison",
-            "[OK] customers_cleaned.csv - Cleaned dataset",
-            "[OK] customers_masked.csv - Masked dataset",
-            "[OK] pipeline_execution_report.txt - This report",
+            *(line.format(ext=self.output_format) for line in deliverables),
             "",
             "STATUS: SUCCESS",
             ""
@@ -2,53 +2,67 @@
 Data Profiler: Analyzes data completeness, types, and quality issues.
 """
 
+import numpy as np
 import pandas as pd
 import logging
-from typing import Dict, List, Tuple
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 from pathlib import Path
 import re
 from datetime import datetime
 
+from src._columns import regex_test
+from src._dtypes import TEXT_DTYPE
+
 logger = logging.getLogger(__name__)
 
+_PHONE_RE = re.compile(r'^\d{3}-\d{3}-\d{4}$')
+_DATE_RE = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+
 
 class DataProfiler:
     """Profiles raw data to identify quality issues."""
     
-    def __init__(self, csv_path: str):
-        """Initialize profiler with CSV file."""
+    def __init__(self, df: Optional[pd.DataFrame] = None, csv_path: Optional[str] = None):
+        """Initialize profiler with an in-memory DataFrame or a CSV file to load on demand."""
+        if df is None and csv_path is None:
+            raise ValueError("DataProfiler needs a DataFrame or a csv_path")
+        
         self.csv_path = csv_path
-        self.df = None
+        self.df = df
+        self._stripped = None
+        self._stripped_source = None
         self.quality_issues = []
         self.format_issues = {
             'phone': set(),
             'date': set(),
             'case': set()
         }
-        logger.info(f"Initialized DataProfiler with {csv_path}")
+        source = csv_path if df is None else f"DataFrame ({len(df)} rows)"
+        logger.info("Initialized DataProfiler with %s", source)
     
     def load_data(self) -> pd.DataFrame:
         """Load CSV file."""
         try:
-            self.df = pd.read_csv(self.csv_path, dtype=str)
-            logger.info(f"Loaded {len(self.df)} rows from {self.csv_path}")
+            self.df = pd.read_csv(self.csv_path, dtype=TEXT_DTYPE)
+            logger.info("Loaded %d rows from %s", len(self.df), self.csv_path)
             return self.df
         except Exception as e:
-            logger.error(f"Failed to load CSV: {e}")
+            logger.error("Failed to load CSV: %s", e)
             raise
     
     def analyze_completeness(self) -> Dict[str, float]:
         """Calculate completeness percentage per column."""
         completeness = {}
         total_rows = len(self.df)
+        # Count non-empty strings (missing values compare as NA and are skipped)
+        non_empty_counts = (self._stripped_frame() != '').sum()
         
         for col in self.df.columns:
-            non_empty = self.df[col].notna().sum()
-            # Count non-empty strings (exclude NaN)
-            non_empty = sum(1 for val in self.df[col] if pd.notna(val) and str(val).strip())
+            non_empty = int(non_empty_counts[col])
             percentage = (non_empty / total_rows * 100) if total_rows > 0 else 0
             completeness[col] = percentage
-            logger.debug(f"{col}: {percentage:.1f}% complete ({non_empty}/{total_rows})")
+            logger.debug("%s: %.1f%% complete (%d/%d)", col, percentage, non_empty, total_rows)
         
         return completeness
     
@@ -57,9 +71,7 @@ class DataProfiler:
         types_found = {}
         
         for col in self.df.columns:
-            # All loaded as strings initially
-            sample_values = self.df[col].dropna().head(5).tolist()
-            
+            # All loaded as strings initially; types are assigned by column name
             if col == 'customer_id':
                 types_found[col] = 'INT'
             elif col in ['first_name', 'last_name', 'address', 'account_status']:
@@ -75,10 +87,40 @@ class DataProfiler:
             else:
                 types_found[col] = 'STRING'
             
-            logger.debug(f"{col}: detected as {types_found[col]}")
+            logger.debug("%s: detected as %s", col, types_found[col])
         
         return types_found
     
+    # Row checks below run as whole-column ops. If one ever needs a Python row
+    # loop, use df.itertuples(name=None); iterrows() builds a Series per row.
+    def _stripped_frame(self) -> pd.DataFrame:
+        """Every column as stripped strings (missing stays NA), built once per DataFrame."""
+        if self._stripped is None or self._stripped_source is not self.df:
+            self._stripped = self.df.astype(TEXT_DTYPE).apply(lambda values: values.str.strip())
+            self._stripped_source = self.df
+        return self._stripped
+    
+    def _present_values(self, col: str, skip_nan_text: bool = False, lower: bool = False) -> pd.Series:
+        """Stripped (optionally lowercased) values of a column with missing and blank cells left out."""
+        values = self._stripped_frame()[col]
+        if lower:
+            values = values.str.lower()
+        # Missing values compare as NA, so one mask covers missing, blank and 'nan'
+        present = values != ''
+        if skip_nan_text:
+            present &= values != 'nan'
+        return values[present.fillna(False)]
+    
+    @staticmethod
+    def _flagged_rows(values: pd.Series, bad: pd.Series, label: str = None) -> List[Tuple[int, str]]:
+        """(row number, value) pairs for flagged values; +2 for header + 1-index."""
+        idxs = np.flatnonzero(bad.to_numpy(dtype=bool))
+        row_numbers = (values.index.to_numpy()[idxs] + 2).tolist()
+        flagged = values.to_numpy()[idxs].tolist()
+        if label:
+            flagged = [f"{label}: {value}" for value in flagged]
+        return list(zip(row_numbers, flagged))
+    
     def detect_format_issues(self) -> Dict[str, List[Tuple[int, str]]]:
         """Identify format inconsistencies."""
         issues = {
@@ -87,57 +129,52 @@ class DataProfiler:
             'case': [],
             'names': []
         }
+        if len(self.df) == 0:
+            return issues
         
         # Phone format issues
-        for idx, row in self.df.iterrows():
-            phone = str(row['phone']).strip()
-            if pd.notna(row['phone']) and phone:
-                # Detect different formats
-                if not re.match(r'^\d{3}-\d{3}-\d{4}$', phone):
-                    issues['phone'].append((idx + 2, phone))  # +2 for header + 1-index
-        
-        # Date format issues
-        for idx, row in self.df.iterrows():
-            dob = str(row['date_of_birth']).strip()
-            created = str(row['created_date']).strip()
-            
-            if pd.notna(row['date_of_birth']) and dob != 'nan' and dob:
-                if not re.match(r'^\d{4}-\d{2}-\d{2}$', dob):
-                    issues['date'].append((idx + 2, f"date_of_birth: {dob}"))
-            
-            if pd.notna(row['created_date']) and created != 'nan' and created:
-                if not re.match(r'^\d{4}-\d{2}-\d{2}$', created):
-                    issues['date'].append((idx + 2, f"created_date: {created}"))
+        phone = self._present_values('phone')
+        bad = ~regex_test(phone, 'match', _PHONE_RE)
+        issues['phone'] = self._flagged_rows(phone, bad)
+        
+        # Date format issues, reported in row order (date_of_birth first within a row)
+        date_issues = []
+        for col in ('date_of_birth', 'created_date'):
+            dates = self._present_values(col, skip_nan_text=True)
+            bad = ~regex_test(dates, 'match', _DATE_RE)
+            date_issues.extend(self._flagged_rows(dates, bad, label=col))
+        issues['date'] = sorted(date_issues, key=itemgetter(0))
         
         # Case issues (names that aren't title case)
-        for idx, row in self.df.iterrows():
-            fname = str(row['first_name']).strip()
-            lname = str(row['last_name']).strip()
-            
-            if pd.notna(row['first_name']) and fname and fname != fname.title():
-                issues['case'].append((idx + 2, f"first_name: {fname}"))
-            
-            if pd.notna(row['last_name']) and lname and lname != lname.title():
-                issues['case'].append((idx + 2, f"last_name: {lname}"))
+        case_issues = []
+        for col in ('first_name', 'last_name'):
+            names = self._present_values(col)
+            bad = names != names.str.title()
+            case_issues.extend(self._flagged_rows(names, bad, label=col))
+        issues['case'] = sorted(case_issues, key=itemgetter(0))
         
-        logger.info(f"Detected {len(issues['phone'])} phone format issues, "
-                   f"{len(issues['date'])} date format issues, "
-                   f"{len(issues['case'])} case issues")
+        logger.info("Detected %d phone format issues, %d date format issues, "
+                    "%d case issues", len(issues['phone']), len(issues['date']),
+                    len(issues['case']))
         
         return issues
     
     def check_uniqueness(self) -> Dict[str, Tuple[int, int]]:
         """Check uniqueness constraints."""
         uniqueness = {}
+        if len(self.df) == 0:
+            return {col: (0, 0) for col in self.df.columns}
+        
+        totals = self.df.count()
+        unique_counts = self.df.nunique(dropna=True)
         
         for col in self.df.columns:
-            total = len(self.df[col].dropna())
-            unique = len(self.df[col].dropna().unique())
-            duplicates = total - unique
+            unique = int(unique_counts[col])
+            duplicates = int(totals[col]) - unique
             uniqueness[col] = (unique, duplicates)
             
             if duplicates > 0:
-                logger.warning(f"{col}: {duplicates} duplicates found")
+                logger.warning("%s: %d duplicates found", col, duplicates)
         
         return uniqueness
     
@@ -147,48 +184,54 @@ class DataProfiler:
         valid_statuses = {'active', 'inactive', 'suspended'}
         
         # account_status validation
-        invalid_statuses = []
-        for idx, row in self.df.iterrows():
-            status = str(row['account_status']).strip().lower()
-            if pd.notna(row['account_status']) and status and status != 'nan':
-                if status not in valid_statuses:
-                    invalid_statuses.append((idx + 2, status))
-        
-        found_statuses = set(self.df['account_status'].dropna().unique())
+        statuses = self._present_values('account_status', skip_nan_text=True, lower=True)
+        invalid_statuses = self._flagged_rows(statuses, ~statuses.isin(valid_statuses))
+        
+        found_statuses = set(self.df['account_status'].dropna().unique().tolist())
         validity['account_status'] = (list(found_statuses), invalid_statuses)
         
-        logger.info(f"account_status: found {found_statuses}, invalid: {len(invalid_statuses)}")
+        logger.info("account_status: found %s, invalid: %d", found_statuses, len(invalid_statuses))
         
         return validity
     
+    def _numeric_values(self, col: str) -> np.ndarray:
+        """Column parsed as float64 in a single pass, unparseable values as NaN."""
+        return pd.to_numeric(self.df[col], errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    
+    @staticmethod
+    def _min_max(values: np.ndarray) -> Dict[str, float]:
+        """NaN-skipping min/max; NaN for a column with no numeric values."""
+        present = values[~np.isnan(values)]
+        if not present.size:
+            return {'min': np.nan, 'max': np.nan}
+        return {'min': present.min(), 'max': present.max()}
+    
     def check_value_ranges(self) -> Dict[str, Dict]:
         """Check if values are within expected ranges."""
         ranges = {}
         
         # Customer ID checks
         try:
-            customer_ids = pd.to_numeric(self.df['customer_id'], errors='coerce')
+            customer_ids = self._numeric_values('customer_id')
             ranges['customer_id'] = {
-                'min': customer_ids.min(),
-                'max': customer_ids.max(),
-                'invalid': (customer_ids < 0).sum()
+                **self._min_max(customer_ids),
+                'invalid': int(np.count_nonzero(customer_ids < 0))
             }
         except:
             ranges['customer_id'] = {'error': 'Could not parse customer_id'}
         
         # Income checks
         try:
-            incomes = pd.to_numeric(self.df['income'], errors='coerce')
+            incomes = self._numeric_values('income')
             ranges['income'] = {
-                'min': incomes.min(),
-                'max': incomes.max(),
-                'negative': (incomes < 0).sum(),
-                'over_10m': (incomes > 10_000_000).sum()
+                **self._min_max(incomes),
+                'negative': int(np.count_nonzero(incomes < 0)),
+                'over_10m': int(np.count_nonzero(incomes > 10_000_000))
             }
         except:
             ranges['income'] = {'error': 'Could not parse income'}
         
-        logger.info(f"Value ranges analyzed: {ranges}")
+        logger.info("Value ranges analyzed: %s", ranges)
         
         return ranges
     
@@ -204,12 +247,15 @@ class DataProfiler:
         categorical = self.check_categorical_validity()
         ranges = self.check_value_ranges()
         
+        total_rows = len(self.df)
+        non_null_counts = self.df.count()
+        
         report_lines = [
             "DATA QUALITY PROFILE REPORT",
             "===========================",
             "",
             f"Generated: {datetime.now().isoformat()}",
-            f"Total Rows: {len(self.df)}",
+            f"Total Rows: {total_rows}",
             f"Total Columns: {len(self.df.columns)}",
             "",
             "COMPLETENESS:",
@@ -217,9 +263,8 @@ class DataProfiler:
         ]
         
         for col, pct in completeness.items():
-            missing = len(self.df) - int(self.df[col].notna().sum())
             status = "[OK]" if pct >= 80 else "[WARN]" if pct >= 50 else "[FAIL]"
-            report_lines.append(f"  {status} {col}: {pct:.1f}% ({len(self.df) - missing}/{len(self.df)})")
+            report_lines.append(f"  {status} {col}: {pct:.1f}% ({non_null_counts[col]}/{total_rows})")
         
         report_lines.extend([
             "",
@@ -239,29 +284,17 @@ class DataProfiler:
         
         issue_count = 0
         
-        if format_issues['phone']:
-            report_lines.append(f"  Phone Format Issues ({len(format_issues['phone'])}):")
-            for row_num, value in format_issues['phone'][:5]:
-                report_lines.append(f"    - Row {row_num}: '{value}'")
-            issue_count += len(format_issues['phone'])
-        
-        if format_issues['date']:
-            report_lines.append(f"  Date Format Issues ({len(format_issues['date'])}):")
-            for row_num, value in format_issues['date'][:5]:
-                report_lines.append(f"    - Row {row_num}: '{value}'")
-            issue_count += len(format_issues['date'])
-        
-        if format_issues['case']:
-            report_lines.append(f"  Name Case Issues ({len(format_issues['case'])}):")
-            for row_num, value in format_issues['case'][:3]:
-                report_lines.append(f"    - Row {row_num}: '{value}'")
-            issue_count += len(format_issues['case'])
-        
-        if categorical['account_status'][1]:
-            report_lines.append(f"  Invalid account_status ({len(categorical['account_status'][1])}):")
-            for row_num, value in categorical['account_status'][1][:3]:
-                report_lines.append(f"    - Row {row_num}: '{value}'")
-            issue_count += len(categorical['account_status'][1])
+        issue_sections = [
+            ("Phone Format Issues", format_issues['phone'], 5),
+            ("Date Format Issues", format_issues['date'], 5),
+            ("Name Case Issues", format_issues['case'], 3),
+            ("Invalid account_status", categorical['account_status'][1], 3),
+        ]
+        for title, issues, shown in issue_sections:
+            if issues:
+                report_lines.append(f"  {title} ({len(issues)}):")
+                report_lines.extend(f"    - Row {row_num}: '{value}'" for row_num, value in issues[:shown])
+                issue_count += len(issues)
         
         if ranges['income'].get('negative', 0) > 0:
             report_lines.append(f"  Negative Income: {ranges['income']['negative']} rows")
@@ -279,12 +312,12 @@ class DataProfiler:
         ])
         
         report_text = "\n".join(report_lines)
-        logger.info(f"Generated quality report with {issue_count} issues")
+        logger.info("Generated quality report with %s issues", issue_count)
         
         if output_path:
             Path(output_path).parent.mkdir(parents=True, exist_ok=True)
             with open(output_path, 'w', encoding='utf-8') as f:
                 f.write(report_text)
-            logger.info(f"Report saved to {output_path}")
+            logger.info("Report saved to %s", output_path)
         
         return report_text
@@ -2,48 +2,248 @@
 Validators: Define and apply data validation schemas.
 """
 
+import numpy as np
 import pandas as pd
 import logging
 import re
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+
+from src._columns import RE2_DIVERGENT, regex_test
+from src._dtypes import TEXT_DTYPE
+from src._kernels import count_digits_batch
+
+try:
+    import pyarrow as pa
+except ImportError:
+    pa = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
 
 logger = logging.getLogger(__name__)
 
+VALIDATION_BACKENDS = ('pandas', 'polars')
+
+# Schema both validate_raw and validate_cleaned require, in order
+EXPECTED_COLUMNS = ('customer_id', 'first_name', 'last_name', 'email', 'phone',
+                    'date_of_birth', 'address', 'income', 'account_status', 'created_date')
+
+# Text columns validate_with_details checks beyond customer_id
+_RULE_COLUMNS = ['email', 'phone', 'account_status']
+
+# Columns scanned by PIIDetector, and the PII types in report order
+PII_COLUMNS = ['email', 'phone', 'address', 'date_of_birth', 'first_name', 'last_name']
+PII_TYPES = ['email', 'phone', 'address', 'dob', 'name']
+# detect_pii result array for each PII type, and the layout of its hits
+_PII_RESULT_KEYS = ['emails', 'phones', 'addresses', 'dobs', 'names']
+_PII_HIT_DTYPE = np.dtype([('row', np.int64), ('value', object)])
+
+# PII types and their count for every combination of per-type bit flags
+_PII_FLAG_TYPES = [
+    tuple(pii_type for bit, pii_type in enumerate(PII_TYPES) if flags >> bit & 1)
+    for flags in range(1 << len(PII_TYPES))
+]
+_PII_FLAG_COUNTS = np.array([len(types) for types in _PII_FLAG_TYPES], dtype=np.uint8)
+
+VALID_STATUSES = ['active', 'inactive', 'suspended']
+
+# Compiled once at import. Patterns keep re's semantics (Unicode \d, $ before
+# a trailing newline): they run through regex_test, or are re-checked with re
+# by the polars backend, wherever RE2 or Rust regex could disagree. Only the
+# customer_id pre-checks spell [0-9], since int() decides everything else.
+# Dots only separate domain labels and the parts are length-capped, so a
+# failed match can't backtrack across ambiguous '.' positions
+_EMAIL_RE = re.compile(r'^[A-Za-z0-9._%+\-]{1,64}@[A-Za-z0-9\-]+(?:\.[A-Za-z0-9\-]+)*\.[A-Za-z]{2,24}$')
+_PHONE_FMT_RE = re.compile(r'^\d{3}-\d{3}-\d{4}$')
+_NONDIGIT_RE = re.compile(r'\D')
+# Strings int() is known to accept (ASCII digits, optional sign, ASCII whitespace),
+# and the subset of them it parses to a positive value
+_ASCII_INT_RE = re.compile(r'[ \t\n\r\f\v]*[+-]?[0-9]+[ \t\n\r\f\v]*')
+_POSITIVE_INT_RE = re.compile(r'[ \t\n\r\f\v]*\+?0*[1-9][0-9]*[ \t\n\r\f\v]*')
+_PHONE_DIGITS_RE = re.compile(r'\d{3}')
+_DOB_RE = re.compile(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}')
+_PHONE_LIKE_RE = re.compile(r'[\d\-\.\(\)\s]{10,}')  # Flexible phone pattern
+_SSN_RE = re.compile(r'\d{3}-\d{2}-\d{4}')
+_CREDIT_CARD_RE = re.compile(r'\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}')
+
+
+def _customer_id_issue(cid) -> Optional[str]:
+    """Issue message for a customer_id that isn't a positive integer, else None."""
+    try:
+        if int(cid) <= 0:
+            return "customer_id must be positive"
+    except:
+        return "customer_id must be integer"
+    return None
+
+
+def _customer_id_issues(values: pd.Series) -> np.ndarray:
+    """_customer_id_issue for a whole column, as an object array (None = no issue).
+    
+    Integer columns and plain ASCII integer strings are checked vectorized;
+    anything else (floats, NaN, Unicode digits, ...) falls back to int().
+    """
+    if pd.api.types.is_integer_dtype(values.dtype) and not values.hasnans:
+        return np.where(values.to_numpy() <= 0, "customer_id must be positive", None)
+    
+    text = values.astype(TEXT_DTYPE)
+    issues = np.full(len(values), None, dtype=object)
+    suspect = np.flatnonzero(~_text_mask(text.str.fullmatch(_POSITIVE_INT_RE)))
+    if len(suspect):
+        nonpositive = _text_mask(text.iloc[suspect].str.fullmatch(_ASCII_INT_RE))
+        issues[suspect[nonpositive]] = "customer_id must be positive"
+        fallback = suspect[~nonpositive]
+        for pos, cid in zip(fallback, values.iloc[fallback].to_numpy()):
+            issues[pos] = _customer_id_issue(cid)
+    return issues
+
+
+def _customer_id_issues_polars(values) -> np.ndarray:
+    """_customer_id_issues for a polars Series, with the same vectorized/int() split."""
+    if values.dtype.is_integer() and values.null_count() == 0:
+        return np.where(values.to_numpy() <= 0, "customer_id must be positive", None)
+    
+    text = values.cast(pl.Utf8)
+    issues = np.full(len(values), None, dtype=object)
+    suspect = np.flatnonzero(~text.str.contains(f"^(?:{_POSITIVE_INT_RE.pattern})$").fill_null(False).to_numpy())
+    if len(suspect):
+        nonpositive = text[suspect].str.contains(f"^(?:{_ASCII_INT_RE.pattern})$").fill_null(False).to_numpy()
+        issues[suspect[nonpositive]] = "customer_id must be positive"
+        fallback = suspect[~nonpositive]
+        for pos, cid in zip(fallback, values[fallback].to_list()):
+            issues[pos] = _customer_id_issue(cid)
+    return issues
+
+
+def _polars_matches(values, pattern: re.Pattern) -> np.ndarray:
+    """pattern.match over a polars Series, with re's semantics (missing = False).
+    
+    Rust regex runs the column; values where it could disagree with re are
+    re-checked with pattern itself.
+    """
+    text = values.cast(pl.Utf8)
+    matches = np.array(text.str.contains(f"^(?:{pattern.pattern})").fill_null(False).to_numpy(), dtype=bool)
+    recheck = np.flatnonzero(text.str.contains(RE2_DIVERGENT).fill_null(False).to_numpy())
+    if len(recheck):
+        matches[recheck] = [pattern.match(value) is not None for value in text[recheck].to_list()]
+    return matches
+
+
+def _failing_row_data(df: pd.DataFrame, failing: np.ndarray) -> List[Tuple[int, Dict]]:
+    """(row number, column -> value) for the failing row positions of a pandas frame."""
+    columns = df.columns.tolist()
+    return [
+        (row[0] + 2, dict(zip(columns, row[1:])))  # +1 for header, +1 for 0-indexing
+        for row in df.iloc[failing].itertuples(index=True, name=None)
+    ]
+
+
+def _failure_record(row_number: int, data: Dict, cid_issue: Optional[str], email_bad: bool,
+                    phone_bad: bool, status_bad: bool, is_cleaned: bool) -> Dict:
+    """Detailed failure entry for one row from its per-rule results."""
+    row_issues = []
+    if cid_issue:
+        row_issues.append(cid_issue)
+    if email_bad:
+        row_issues.append(f"Invalid email format: {data['email']}")
+    if phone_bad:
+        if is_cleaned:
+            row_issues.append(f"Phone must be XXX-XXX-XXXX format: {data['phone']}")
+        else:
+            row_issues.append(f"Phone number too short: {data['phone']}")
+    if status_bad:
+        row_issues.append(f"Invalid account_status: {data['account_status']}")
+    
+    return {
+        'row_number': row_number,
+        'issues': row_issues,
+        'data': data
+    }
+
+
+def _validation_summary(total_rows: int, failed_rows: List[Dict]) -> Dict:
+    """validate_with_details result for the given failures."""
+    return {
+        'total_rows': total_rows,
+        'passed_rows': total_rows - len(failed_rows),
+        'failed_rows': failed_rows,
+        'failure_count': len(failed_rows),
+        'pass_rate': (total_rows - len(failed_rows)) / total_rows * 100 if total_rows > 0 else 0
+    }
+
+
+def _chunk_digit_counts(arr) -> np.ndarray:
+    """count_digits_batch over one Arrow string array."""
+    arr = arr.cast(pa.large_string())
+    _, offsets, data = arr.buffers()
+    offsets = np.frombuffer(offsets, dtype=np.int64)[arr.offset:arr.offset + len(arr) + 1]
+    data = np.frombuffer(data, dtype=np.uint8) if data is not None else np.empty(0, dtype=np.uint8)
+    return count_digits_batch(offsets, data)
+
+
+def _digit_counts(values: pd.Series) -> np.ndarray:
+    """Number of digits in each string of values (0 for missing)."""
+    if count_digits_batch is not None and pa is not None and values.dtype.storage == 'pyarrow':
+        # Compiled scan straight over the Arrow offsets/data buffers; large
+        # inputs arrive as several chunks, each with its own buffers
+        arr = pa.array(values.array)
+        chunks = arr.chunks if isinstance(arr, pa.ChunkedArray) else [arr]
+        counts = np.concatenate([_chunk_digit_counts(chunk) for chunk in chunks] or [np.empty(0, dtype=np.int64)])
+        non_ascii = np.flatnonzero(counts < 0)
+        if len(non_ascii):
+            counts[non_ascii] = [len(_NONDIGIT_RE.sub('', value)) for value in values.iloc[non_ascii]]
+        return counts
+    return values.str.replace(_NONDIGIT_RE, '', regex=True).str.len().fillna(0).to_numpy(np.int64)
+
+
+def _pii_hits(rows: np.ndarray, values) -> np.ndarray:
+    """Structured array pairing each PII hit's row number with its value."""
+    hits = np.empty(len(rows), dtype=_PII_HIT_DTYPE)
+    hits['row'] = rows
+    hits['value'] = values
+    return hits
+
+
+def _text_mask(matches: pd.Series) -> np.ndarray:
+    """Boolean array from a string-op result, with missing values as False."""
+    return matches.fillna(False).to_numpy(dtype=bool)
+
+
+def _present_mask(values: pd.Series) -> np.ndarray:
+    """True where a string value is neither missing nor empty."""
+    return _text_mask(values.str.len() > 0)
+
 
 class DataValidator:
     """Validates data against defined schemas."""
     
-    def __init__(self):
-        logger.info("Initialized DataValidator with manual schemas")
+    def __init__(self, backend: str = 'pandas'):
+        """Initialize validator.
+        
+        backend='polars' runs validate_with_details as a multi-threaded polars
+        query (needs polars); pandas stays the default.
+        """
+        if backend not in VALIDATION_BACKENDS:
+            raise ValueError(f"backend must be one of {VALIDATION_BACKENDS}, got {backend!r}")
+        if backend == 'polars' and pl is None:
+            raise ImportError("backend='polars' requires the polars package")
+        
+        self.backend = backend
+        logger.info("Initialized DataValidator with manual schemas (%s backend)", backend)
     
     def validate_raw(self, df: pd.DataFrame) -> Tuple[bool, Dict]:
         """Validate raw data against raw schema."""
-        logger.info("Starting raw data validation...")
-        failures = {
-            'row_count': 0,
-            'column_failures': {},
-            'failed_rows': []
-        }
-        
-        try:
-            # Simple check that all columns exist
-            expected_cols = ['customer_id', 'first_name', 'last_name', 'email', 'phone',
-                           'date_of_birth', 'address', 'income', 'account_status', 'created_date']
-            if list(df.columns) != expected_cols:
-                raise ValueError(f"Column mismatch: expected {expected_cols}, got {list(df.columns)}")
-            
-            logger.info("Raw data validation PASSED")
-            return True, failures
-            
-        except Exception as e:
-            logger.warning(f"Raw data validation FAILED: {e}")
-            failures['error'] = str(e)
-            failures['row_count'] = len(df)
-            return False, failures
+        return self._validate_columns(df, 'raw')
     
     def validate_cleaned(self, df: pd.DataFrame) -> Tuple[bool, Dict]:
         """Validate cleaned data against cleaned schema."""
-        logger.info("Starting cleaned data validation...")
+        return self._validate_columns(df, 'cleaned')
+    
+    def _validate_columns(self, df: pd.DataFrame, label: str) -> Tuple[bool, Dict]:
+        """Check df has exactly EXPECTED_COLUMNS; label names the stage in logs."""
+        logger.info("Starting %s data validation...", label)
         failures = {
             'row_count': 0,
             'column_failures': {},
@@ -52,72 +252,100 @@ class DataValidator:
         
         try:
             # Simple check that all columns exist
-            expected_cols = ['customer_id', 'first_name', 'last_name', 'email', 'phone',
-                           'date_of_birth', 'address', 'income', 'account_status', 'created_date']
-            if list(df.columns) != expected_cols:
-                raise ValueError(f"Column mismatch: expected {expected_cols}, got {list(df.columns)}")
+            if len(df.columns) != len(EXPECTED_COLUMNS) or tuple(df.columns) != EXPECTED_COLUMNS:
+                raise ValueError(f"Column mismatch: expected {list(EXPECTED_COLUMNS)}, got {list(df.columns)}")
             
-            logger.info("Cleaned data validation PASSED")
+            logger.info("%s data validation PASSED", label.capitalize())
             return True, failures
             
         except Exception as e:
-            logger.warning(f"Cleaned data validation FAILED: {e}")
+            logger.warning("%s data validation FAILED: %s", label.capitalize(), e)
             failures['error'] = str(e)
             failures['row_count'] = len(df)
             return False, failures
     
     def validate_with_details(self, df: pd.DataFrame, is_cleaned: bool = False) -> Dict:
-        """Run detailed validation with row-level reporting."""
-        logger.info(f"Running detailed validation (cleaned={is_cleaned})...")
+        """Run detailed validation with row-level reporting.
         
-        failed_rows = []
+        df may also be a polars DataFrame, which is always validated with
+        the polars backend.
+        """
+        logger.info("Running detailed validation (cleaned=%s)...", is_cleaned)
         
-        # Manual row-by-row validation for detailed reporting
-        for idx, row in df.iterrows():
-            row_issues = []
-            
-            # Check customer_id
-            try:
-                cid = int(row['customer_id'])
-                if cid <= 0:
-                    row_issues.append("customer_id must be positive")
-            except:
-                row_issues.append("customer_id must be integer")
-            
-            # Check email format if not empty
-            if pd.notna(row['email']) and str(row['email']).strip():
-                if not re.match(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$', str(row['email'])):
-                    row_issues.append(f"Invalid email format: {row['email']}")
-            
-            # Check phone format if not empty
-            if pd.notna(row['phone']) and str(row['phone']).strip():
-                phone_clean = re.sub(r'\D', '', str(row['phone']))
-                if is_cleaned:
-                    if not re.match(r'^\d{3}-\d{3}-\d{4}$', str(row['phone'])):
-                        row_issues.append(f"Phone must be XXX-XXX-XXXX format: {row['phone']}")
-                elif len(phone_clean) < 10:
-                    row_issues.append(f"Phone number too short: {row['phone']}")
-            
-            # Check account_status
-            if pd.notna(row['account_status']) and str(row['account_status']).strip():
-                status = str(row['account_status']).strip().lower()
-                if status not in ['active', 'inactive', 'suspended']:
-                    row_issues.append(f"Invalid account_status: {row['account_status']}")
-            
-            if row_issues:
-                failed_rows.append({
-                    'row_number': idx + 2,  # +1 for header, +1 for 0-indexing
-                    'issues': row_issues,
-                    'data': row.to_dict()
-                })
-        
-        return {
-            'total_rows': len(df),
-            'passed_rows': len(df) - len(failed_rows),
-            'failed_rows': failed_rows,
-            'failure_count': len(failed_rows),
-            'pass_rate': (len(df) - len(failed_rows)) / len(df) * 100 if len(df) > 0 else 0
-        }
+        if self.backend == 'polars' or (pl is not None and isinstance(df, pl.DataFrame)):
+            return self._validate_polars(df, is_cleaned)
+        
+        # Each rule is checked over the whole column; only failing rows are
+        # then visited to assemble their issue messages
+        cid_issues = _customer_id_issues(df['customer_id'])
+        
+        text = df[_RULE_COLUMNS].astype(TEXT_DTYPE)
+        stripped = text.apply(lambda values: values.str.strip())
+        # Rules only apply to values that are present and not blank: one mask per column
+        nonblank = dict(zip(_RULE_COLUMNS, _text_mask(stripped != '').T))
+        
+        email_bad = nonblank['email'] & ~_text_mask(regex_test(text['email'], 'match', _EMAIL_RE))
+        
+        phones = text['phone']
+        if is_cleaned:
+            phone_bad = ~_text_mask(regex_test(phones, 'match', _PHONE_FMT_RE))
+        else:
+            phone_bad = _digit_counts(phones) < 10
+        phone_bad = nonblank['phone'] & phone_bad
+        
+        statuses = stripped['account_status']
+        status_bad = nonblank['account_status'] & _text_mask(~statuses.str.lower().isin(VALID_STATUSES))
+        
+        cid_bad = cid_issues.astype(bool)
+        failing = np.flatnonzero(cid_bad | email_bad | phone_bad | status_bad)
+        
+        failed_rows = [
+            _failure_record(row_number, data, cid_issues[pos], email_bad[pos], phone_bad[pos], status_bad[pos], is_cleaned)
+            for pos, (row_number, data) in zip(failing, _failing_row_data(df, failing))
+        ]
+        return _validation_summary(len(df), failed_rows)
+    
+    def _validate_polars(self, df, is_cleaned: bool) -> Dict:
+        """validate_with_details with the text rules as one lazy polars query."""
+        frame = df if isinstance(df, pl.DataFrame) else pl.from_pandas(df)
+        
+        def text(col: str):
+            return pl.col(col).cast(pl.Utf8)
+        
+        def present(col: str):
+            return text(col).str.strip_chars() != ''
+        
+        # Rust's \D, like re's, treats all Unicode digits as digits. The email
+        # and cleaned phone patterns are matched below, with re's semantics.
+        phone_rule = pl.lit(True) if is_cleaned else text('phone').str.replace_all(r'\D', '').str.len_chars() < 10
+        statuses = text('account_status').str.strip_chars()
+        
+        checks = (
+            frame.lazy()
+            .select(
+                present('email').fill_null(False).alias('email_bad'),
+                (present('phone') & phone_rule).fill_null(False).alias('phone_bad'),
+                ((statuses != '') & ~statuses.str.to_lowercase().is_in(VALID_STATUSES)).fill_null(False).alias('status_bad'),
+            )
+            .collect()
+        )
+        cid_issues = _customer_id_issues_polars(frame['customer_id'])
+        email_bad, phone_bad, status_bad = (checks[col].to_numpy() for col in checks.columns)
+        email_bad = email_bad & ~_polars_matches(frame['email'], _EMAIL_RE)
+        if is_cleaned:
+            phone_bad = phone_bad & ~_polars_matches(frame['phone'], _PHONE_FMT_RE)
+        
+        failing = np.flatnonzero(cid_issues.astype(bool) | email_bad | phone_bad | status_bad)
+        if isinstance(df, pl.DataFrame):
+            row_data = [(pos + 2, data) for pos, data in zip(failing.tolist(), df[failing].rows(named=True))]
+        else:
+            row_data = _failing_row_data(df, failing)
+        
+        failed_rows = [
+            _failure_record(row_number, data, cid_issues[pos], email_bad[pos], phone_bad[pos], status_bad[pos], is_cleaned)
+            for pos, (row_number, data) in zip(failing, row_data)
+        ]
+        return _validation_summary(len(df), failed_rows)
 
 
 class PIIDetector:
@@ -125,72 +353,72 @@ class PIIDetector:
     
     def __init__(self):
         self.pii_patterns = {
-            'email': r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$',
-            'phone': r'[\d\-\.\(\)\s]{10,}',  # Flexible phone pattern
-            'ssn': r'\d{3}-\d{2}-\d{4}',
-            'credit_card': r'\d{4}[\s\-]?\d{4}[\s\-]?\d{4}[\s\-]?\d{4}'
+            'email': _EMAIL_RE,
+            'phone': _PHONE_LIKE_RE,
+            'ssn': _SSN_RE,
+            'credit_card': _CREDIT_CARD_RE
         }
         logger.info("Initialized PIIDetector")
     
     def detect_pii(self, df: pd.DataFrame) -> Dict:
-        """Detect PII in dataframe."""
+        """Detect PII in dataframe.
+        
+        Each PII type maps to a structured array of (row, value) hits, so
+        len() gives its count; high_risk_rows is a list of dicts.
+        """
         logger.info("Scanning for PII...")
         
-        pii_found = {
-            'emails': [],
-            'phones': [],
-            'addresses': [],
-            'dobs': [],
-            'names': [],
-            'high_risk_rows': []
+        pii_found = dict.fromkeys(_PII_RESULT_KEYS)
+        pii_found['high_risk_rows'] = []
+        
+        text = df[PII_COLUMNS].astype(TEXT_DTYPE)
+        # A regex hit or a non-blank stripped value already implies the value
+        # is present, so only email needs its own presence check
+        masks = {
+            'email': _present_mask(text['email']),
+            'phone': _text_mask(regex_test(text['phone'], 'contains', _PHONE_DIGITS_RE)),
+            # Whitespace-only addresses don't count
+            'address': _text_mask(text['address'].str.strip() != ''),
+            'dob': _text_mask(regex_test(text['date_of_birth'], 'contains', _DOB_RE)),
+            'name': (
+                _text_mask(text['first_name'].str.strip() != '') |
+                _text_mask(text['last_name'].str.strip() != '')
+            ),
         }
         
-        for idx, row in df.iterrows():
-            row_num = idx + 2
-            row_pii = []
-            
-            # Email detection
-            if pd.notna(row['email']) and row['email']:
-                pii_found['emails'].append((row_num, row['email']))
-                row_pii.append('email')
-            
-            # Phone detection
-            if pd.notna(row['phone']) and row['phone']:
-                if re.search(r'\d{3}', str(row['phone'])):
-                    pii_found['phones'].append((row_num, row['phone']))
-                    row_pii.append('phone')
-            
-            # Address detection
-            if pd.notna(row['address']) and row['address'] and str(row['address']).strip() and str(row['address']).strip() != '':
-                pii_found['addresses'].append((row_num, row['address']))
-                row_pii.append('address')
-            
-            # DOB detection
-            if pd.notna(row['date_of_birth']) and row['date_of_birth']:
-                if re.search(r'\d{4}-\d{2}-\d{2}|\d{2}/\d{2}/\d{4}', str(row['date_of_birth'])):
-                    pii_found['dobs'].append((row_num, row['date_of_birth']))
-                    row_pii.append('dob')
-            
-            # Names
-            if (pd.notna(row['first_name']) and row['first_name'] and str(row['first_name']).strip()) or \
-               (pd.notna(row['last_name']) and row['last_name'] and str(row['last_name']).strip()):
-                pii_found['names'].append((row_num, f"{row['first_name']} {row['last_name']}"))
-                row_pii.append('name')
-            
-            # High-risk rows (multiple PII types)
-            if len(row_pii) >= 3:
-                pii_found['high_risk_rows'].append({
-                    'row': row_num,
-                    'pii_types': row_pii,
-                    'pii_count': len(row_pii)
-                })
-        
-        logger.info(f"PII Detection Summary: "
-                   f"{len(pii_found['emails'])} emails, "
-                   f"{len(pii_found['phones'])} phones, "
-                   f"{len(pii_found['addresses'])} addresses, "
-                   f"{len(pii_found['dobs'])} DOBs, "
-                   f"{len(pii_found['high_risk_rows'])} high-risk rows")
+        # Column arrays looked up once; results keep the original (uncast) values
+        row_numbers = df.index.to_numpy() + 2
+        values = {col: df[col].to_numpy() for col in PII_COLUMNS}
+        for key, col, mask in [('emails', 'email', masks['email']),
+                               ('phones', 'phone', masks['phone']),
+                               ('addresses', 'address', masks['address']),
+                               ('dobs', 'date_of_birth', masks['dob'])]:
+            pii_found[key] = _pii_hits(row_numbers[mask], values[col][mask])
+        
+        name_mask = masks['name']
+        pii_found['names'] = _pii_hits(
+            row_numbers[name_mask],
+            [f"{first} {last}" for first, last in zip(values['first_name'][name_mask].tolist(),
+                                                      values['last_name'][name_mask].tolist())]
+        )
+        
+        # High-risk rows (multiple PII types): one bit per type, so a row's
+        # count and type list are table lookups on its flags
+        flags = np.zeros(len(df), dtype=np.uint8)
+        for bit, pii_type in enumerate(PII_TYPES):
+            flags |= masks[pii_type].astype(np.uint8) << bit
+        for pos in np.flatnonzero(_PII_FLAG_COUNTS[flags] >= 3):
+            pii_types = _PII_FLAG_TYPES[flags[pos]]
+            pii_found['high_risk_rows'].append({
+                'row': int(row_numbers[pos]),
+                'pii_types': list(pii_types),
+                'pii_count': len(pii_types)
+            })
+        
+        # Lazy %-args: formatted only if an INFO record is actually emitted
+        logger.info("PII Detection Summary: %d emails, %d phones, %d addresses, %d DOBs, %d high-risk rows",
+                    len(pii_found['emails']), len(pii_found['phones']), len(pii_found['addresses']),
+                    len(pii_found['dobs']), len(pii_found['high_risk_rows']))
         
         return pii_found
     
@@ -198,15 +426,19 @@ class PIIDetector:
         """Calculate data breach risk."""
         total_rows = len(df)
         
-        risk = {
-            'total_rows': total_rows,
-            'email_coverage': len(pii_data['emails']) / total_rows * 100,
-            'phone_coverage': len(pii_data['phones']) / total_rows * 100,
-            'address_coverage': len(pii_data['addresses']) / total_rows * 100,
-            'dob_coverage': len(pii_data['dobs']) / total_rows * 100,
-            'name_coverage': len(pii_data['names']) / total_rows * 100,
-            'risk_level': 'CRITICAL' if len(pii_data['high_risk_rows']) > total_rows * 0.5 else 'HIGH',
-            'high_risk_count': len(pii_data['high_risk_rows'])
-        }
+        # Per-type counts in PII_TYPES order, divided in one NumPy pass
+        counts = np.array([len(pii_data[key]) for key in _PII_RESULT_KEYS], dtype=np.float64)
+        high_risk_count = len(pii_data['high_risk_rows'])
+        if total_rows:
+            coverages = counts / total_rows * 100
+            high_risk_frac = high_risk_count / total_rows
+        else:
+            coverages = np.zeros_like(counts)
+            high_risk_frac = 0.0
+        
+        risk = {'total_rows': total_rows}
+        risk.update((f"{pii_type}_coverage", coverage) for pii_type, coverage in zip(PII_TYPES, coverages.tolist()))
+        risk['risk_level'] = 'CRITICAL' if high_risk_frac > 0.5 else 'HIGH'
+        risk['high_risk_count'] = high_risk_count
         
         return risk
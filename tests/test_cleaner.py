@@ -35,6 +35,16 @@ class TestDataCleaner:
         result = cleaner.normalize_phone('(555) 234-5678')
         assert result == '555-234-5678'
     
+    def test_normalize_phone_country_code(self, cleaner):
+        """Test phone with leading country code."""
+        result = cleaner.normalize_phone('1-555-123-4567')
+        assert result == '555-123-4567'
+    
+    def test_normalize_phone_too_short(self, cleaner):
+        """Test short phone is returned unchanged."""
+        result = cleaner.normalize_phone('555-1234')
+        assert result == '555-1234'
+    
     def test_normalize_phone_missing(self, cleaner):
         """Test missing phone."""
         result = cleaner.normalize_phone('')
@@ -53,7 +63,7 @@ class TestDataCleaner:
     def test_normalize_date_invalid(self, cleaner):
         """Test invalid date."""
         result = cleaner.normalize_date('invalid_date')
-        assert result is None
+        assert result is pd.NA
     
     def test_normalize_name_lowercase(self, cleaner):
         """Test normalizing name to title case."""
@@ -85,6 +95,11 @@ class TestDataCleaner:
         result = cleaner.normalize_income('95000.50')
         assert result == 95000
     
+    def test_normalize_income_nan_string(self, cleaner):
+        """Test non-numeric income string."""
+        result = cleaner.normalize_income('nan')
+        assert result == 0
+    
     def test_normalize_income_missing(self, cleaner):
         """Test missing income."""
         result = cleaner.normalize_income('')
@@ -99,3 +114,49 @@ class TestDataCleaner:
         """Test invalid account status."""
         result = cleaner.normalize_account_status('unknown_status')
         assert result == 'unknown'
+    
+    def test_clean_data_normalizes_phones(self, cleaner, sample_raw_data):
+        """Test clean_data normalizes every phone format."""
+        cleaned_df, stats = cleaner.clean_data(sample_raw_data)
+        assert list(cleaned_df['phone']) == ['555-123-4567', '555-987-6543', '555-234-5678', '555-435-6789']
+        assert stats['normalization_actions']['phone_format'] == 3
+    
+    def test_clean_data_normalizes_dates(self, cleaner, sample_raw_data):
+        """Test clean_data normalizes dates and drops unparseable birth dates."""
+        cleaned_df, stats = cleaner.clean_data(sample_raw_data)
+        assert list(cleaned_df['date_of_birth']) == ['1985-03-15', '1990-07-22', '1988-11-08', '1975-05-10']
+        assert stats['rows_dropped'] == 1
+    
+    def test_clean_data_keeps_dates_outside_nanosecond_range(self, cleaner, sample_raw_data):
+        """Test dates before 1677 or after 2262 normalize as normalize_date does."""
+        df = sample_raw_data.assign(date_of_birth=['1600-01-01', '9999-12-31', '12/31/1600', '1985-03-15', 'invalid_date'],
+                                    created_date=['31/12/9999', '2024-01-11', '2024-01-12', '2024-01-13', '01/15/2024'])
+        cleaned_df, stats = cleaner.clean_data(df)
+        assert list(cleaned_df['date_of_birth']) == ['1600-01-01', '9999-12-31', '1600-12-31', '1985-03-15']
+        assert cleaned_df['created_date'].iloc[0] == cleaner.normalize_date('31/12/9999') == '9999-12-31'
+        assert stats['rows_dropped'] == 1
+    
+    def test_clean_data_normalizes_names_and_status(self, cleaner, sample_raw_data):
+        """Test clean_data fills missing names and unknown statuses."""
+        cleaned_df, _ = cleaner.clean_data(sample_raw_data)
+        assert list(cleaned_df['first_name']) == ['John', 'Jane', '[UNKNOWN]', 'Mary']
+        assert list(cleaned_df['account_status']) == ['active', 'active', 'suspended', 'unknown']
+    
+    def test_clean_data_normalizes_income(self, cleaner, sample_raw_data):
+        """Test clean_data converts income to integers."""
+        cleaned_df, _ = cleaner.clean_data(sample_raw_data)
+        assert list(cleaned_df['income']) == [75000, 95000, 0, 120000]
+    
+    def test_clean_data_phones_match_scalar(self, cleaner, sample_raw_data):
+        """Test column phone cleaning agrees with normalize_phone on non-ASCII digits."""
+        df = sample_raw_data.assign(phone=['５５５-１２３-４５６７', '1 (555) 987-6543', '555\x0b234\x0b5678', '12', '555.435.6789'])
+        cleaned_df, _ = cleaner.clean_data(df)
+        expected = [cleaner.normalize_phone(v) for v in df['phone'][:4]]
+        assert list(cleaned_df['phone']) == expected
+    
+    def test_clean_data_parallel_matches_serial(self, cleaner, sample_raw_data):
+        """Test parallel column cleaning gives the same result as serial."""
+        serial_df, serial_stats = cleaner.clean_data(sample_raw_data)
+        parallel_df, parallel_stats = DataCleaner(parallel_columns=True).clean_data(sample_raw_data)
+        pd.testing.assert_frame_equal(serial_df, parallel_df)
+        assert serial_stats == parallel_stats
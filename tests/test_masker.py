@@ -99,3 +99,39 @@ class TestPIIMasker:
         result2 = masker.mask_dataframe(sample_df.copy())
         
         assert result1.equals(result2), "Masking should be deterministic"
+    
+    def test_mask_dataframe_masks_columns(self, masker, sample_clean_data):
+        """Test mask_dataframe masks every PII column."""
+        masked_df = masker.mask_dataframe(sample_clean_data)
+        assert list(masked_df['first_name']) == ['J***', 'J***', 'B***']
+        assert list(masked_df['email']) == ['j***@example.com', 'j***@example.com', 'b***@example.com']
+        assert list(masked_df['phone']) == ['***-***-4567', '***-***-6543', '***-***-5678']
+        assert list(masked_df['date_of_birth']) == ['1985-**-**', '1990-**-**', '1988-**-**']
+    
+    def test_mask_dataframe_matches_scalar_masks(self, masker, sample_clean_data):
+        """Test column masking agrees with the scalar masks on ASCII and non-ASCII text."""
+        df = pd.concat([sample_clean_data] * 2, ignore_index=True)
+        df['first_name'] = ['a b  c', 'Zoë Ann', 'J\x0bK', 'Mary-Jo X', 'Ｊｏｈｎ', ' ']
+        df['email'] = ['A@x.com', 'é@x.com', 'ab@x.com', '@x.com', 'no-at', 'Ünï@x.com']
+        df['phone'] = ['(555) 123-4567', '５５５-１２３-４５６７', '12', '555.987.6543', 'x', '1\x0b234']
+        masked_df = masker.mask_dataframe(df)
+        
+        assert list(masked_df['first_name']) == [masker.mask_name(v) for v in df['first_name']]
+        assert list(masked_df['email']) == [masker.mask_email(v) for v in df['email']]
+        assert list(masked_df['phone']) == [masker.mask_phone(v) for v in df['phone']]
+    
+    def test_mask_dataframe_dob_matches_scalar(self, masker, sample_clean_data):
+        """Test column DOB masking agrees with mask_dob on non-ASCII-digit years."""
+        df = pd.concat([sample_clean_data] * 2, ignore_index=True)
+        df['date_of_birth'] = ['１９８５-03-15', '٢٠٠٠-01-01', '1985-03-15', '85-03-15', '[UNKNOWN]', '']
+        masked_df = masker.mask_dataframe(df)
+        
+        assert list(masked_df['date_of_birth']) == [masker.mask_dob(v) for v in df['date_of_birth']]
+    
+    def test_generate_masked_sample_quotes_commas(self, masker, sample_clean_data):
+        """Test sample rows containing commas are quoted."""
+        original_df = sample_clean_data.assign(address=['123 Main St, Apt 4', '456 Oak Ave', '789 Pine Rd'])
+        masked_df = masker.mask_dataframe(original_df)
+        sample = masker.generate_masked_sample(original_df, masked_df, num_rows=1)
+        assert '"123 Main St, Apt 4"' in sample
+        assert 'customer_id,first_name' in sample
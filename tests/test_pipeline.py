@@ -0,0 +1,117 @@
+"""
+Unit tests for pipeline module.
+"""
+
+import pytest
+import pandas as pd
+from src.pipeline import DataPipeline, _DatasetWriter
+
+
+class TestDataPipeline:
+    """Tests for DataPipeline class."""
+    
+    @pytest.fixture
+    def input_csv(self, tmp_path, sample_raw_data):
+        """Write sample raw data to a CSV file."""
+        path = tmp_path / "customers_raw.csv"
+        sample_raw_data.to_csv(path, index=False)
+        return path
+    
+    def test_stage_1_load_text_dtype(self, tmp_path, input_csv):
+        """Test raw columns load as strings with missing values as NA."""
+        df, success = DataPipeline(str(input_csv), str(tmp_path)).stage_1_load()
+        assert success
+        assert all(isinstance(dtype, pd.StringDtype) for dtype in df.dtypes)
+        assert df['first_name'].isna().sum() == 1
+    
+    def test_execute(self, tmp_path, input_csv):
+        """Test full pipeline writes the cleaned and masked datasets."""
+        output_dir = tmp_path / "output"
+        assert DataPipeline(str(input_csv), str(output_dir)).execute()
+        
+        cleaned = pd.read_csv(output_dir / "customers_cleaned.csv", dtype=str)
+        assert len(cleaned) == 4
+        assert (output_dir / "customers_masked.csv").exists()
+        assert (output_dir / "pipeline_execution_report.txt").exists()
+    
+    def test_execute_empty_input(self, tmp_path, sample_raw_data):
+        """Test an input with only a header skips the remaining stages."""
+        input_csv = tmp_path / "empty.csv"
+        sample_raw_data.head(0).to_csv(input_csv, index=False)
+        output_dir = tmp_path / "output"
+        
+        assert DataPipeline(str(input_csv), str(output_dir)).execute()
+        report = (output_dir / "pipeline_execution_report.txt").read_text(encoding='utf-8')
+        assert "SKIP" in report
+        assert not (output_dir / "customers_cleaned.csv").exists()
+    
+    def test_execute_streaming_matches_full(self, tmp_path, input_csv):
+        """Test chunked streaming produces the same datasets as a full run."""
+        full_dir = tmp_path / "full"
+        stream_dir = tmp_path / "stream"
+        assert DataPipeline(str(input_csv), str(full_dir)).execute()
+        assert DataPipeline(str(input_csv), str(stream_dir), chunksize=2).execute()
+        
+        for name in ["customers_cleaned.csv", "customers_masked.csv"]:
+            assert (stream_dir / name).read_text() == (full_dir / name).read_text()
+    
+    def test_execute_parallel_stages_matches_serial(self, tmp_path, input_csv):
+        """Test running independent stages on threads produces the same reports."""
+        serial_dir = tmp_path / "serial"
+        parallel_dir = tmp_path / "parallel"
+        assert DataPipeline(str(input_csv), str(serial_dir)).execute()
+        assert DataPipeline(str(input_csv), str(parallel_dir), parallel_stages=True).execute()
+        
+        for name in ["validation_results.txt", "pii_detection_report.txt", "customers_masked.csv"]:
+            assert (parallel_dir / name).read_text() == (serial_dir / name).read_text()
+    
+    def test_execute_parquet_output(self, tmp_path, input_csv):
+        """Test Parquet output holds the same data as CSV output, streamed or not."""
+        pytest.importorskip("pyarrow")
+        csv_dir = tmp_path / "csv"
+        assert DataPipeline(str(input_csv), str(csv_dir)).execute()
+        expected = pd.read_csv(csv_dir / "customers_masked.csv", dtype=str, keep_default_na=False)
+        
+        for chunksize in (None, 2):
+            parquet_dir = tmp_path / f"parquet_{chunksize}"
+            pipeline = DataPipeline(str(input_csv), str(parquet_dir), chunksize=chunksize, output_format='parquet')
+            assert pipeline.execute()
+            
+            masked = pd.read_parquet(parquet_dir / "customers_masked.parquet")
+            actual = masked.astype(str).where(masked.notna(), '')
+            pd.testing.assert_frame_equal(actual, expected, check_dtype=False)
+            assert "customers_cleaned.parquet" in (parquet_dir / "cleaning_log.txt").read_text()
+    
+    def test_dataset_writer_csv_matches_to_csv(self, tmp_path, sample_raw_data):
+        """Test CSV datasets are byte-identical to DataFrame.to_csv, chunked or not."""
+        quoted = sample_raw_data.copy()
+        quoted.loc[0, 'address'] = '123 Main St, Apt "4"'
+        quoted.loc[1, 'first_name'] = None
+        cases = {
+            'plain': [sample_raw_data.astype('string'), sample_raw_data.astype(object)],
+            'quoted': [quoted],
+            'mixed': [sample_raw_data, quoted],
+            'integer': [sample_raw_data.assign(customer_id=range(5), income=pd.array([1, None, 3, 4, 5], dtype='Int64'))],
+            'float': [sample_raw_data.assign(income=[1.5, None, 3.0, 4.25, 1e20])],
+            'bool': [sample_raw_data.assign(income=[True, False, True, False, True])],
+        }
+        
+        for name, chunks in cases.items():
+            path = tmp_path / f"{name}.csv"
+            with _DatasetWriter(path, 'csv') as writer:
+                for chunk in chunks:
+                    writer.write(chunk)
+            
+            expected = pd.concat(chunks, ignore_index=True).to_csv(index=False)
+            assert path.read_bytes() == expected.encode('utf-8'), name
+    
+    def test_invalid_output_format(self, tmp_path, input_csv):
+        """Test unknown output formats are rejected."""
+        with pytest.raises(ValueError):
+            DataPipeline(str(input_csv), str(tmp_path), output_format='xlsx')
+    
+    def test_parquet_output_requires_pyarrow(self, tmp_path, input_csv, monkeypatch):
+        """Test Parquet output fails up front when pyarrow is missing."""
+        monkeypatch.setattr('src.pipeline.pa', None)
+        with pytest.raises(ImportError):
+            DataPipeline(str(input_csv), str(tmp_path), output_format='parquet')
@@ -0,0 +1,98 @@
+"""
+Unit tests for profiler module.
+"""
+
+import pytest
+import pandas as pd
+from src.profiler import DataProfiler
+
+
+class TestDataProfiler:
+    """Tests for DataProfiler class."""
+    
+    @pytest.fixture
+    def profiler(self, sample_raw_data):
+        """Create profiler over the sample raw data."""
+        return DataProfiler(df=sample_raw_data)
+    
+    def test_detect_format_issues_phone(self, profiler):
+        """Test non-canonical phones are reported with their row numbers."""
+        issues = profiler.detect_format_issues()
+        assert issues['phone'] == [(3, '555.987.6543'), (4, '(555) 234-5678'), (5, '5554356789')]
+    
+    def test_detect_format_issues_date(self, profiler):
+        """Test date issues are reported in row order across both date columns."""
+        issues = profiler.detect_format_issues()
+        assert issues['date'] == [
+            (5, 'date_of_birth: 05/10/1975'),
+            (6, 'date_of_birth: invalid_date'),
+            (6, 'created_date: 01/15/2024'),
+        ]
+    
+    def test_detect_format_issues_case(self, profiler):
+        """Test names that aren't title case are reported; blanks are skipped."""
+        issues = profiler.detect_format_issues()
+        assert issues['case'] == [(3, 'first_name: jane')]
+    
+    def test_detect_format_issues_skips_missing(self, profiler, sample_raw_data):
+        """Test missing values are not reported as format issues."""
+        profiler.df = sample_raw_data.replace('', None)
+        profiler.df.loc[0, 'phone'] = None
+        issues = profiler.detect_format_issues()
+        assert [row for row, _ in issues['phone']] == [3, 4, 5]
+    
+    def test_detect_format_issues_unicode_digits(self, sample_raw_data):
+        """Test phones and dates written with non-ASCII digits are accepted, as re's \\d does."""
+        df = sample_raw_data.assign(phone=['５５５-１２３-４５６７'] * 5,
+                                    date_of_birth=['٢٠٢٤-٠١-١٠'] * 5, created_date=['２０２４-０１-１０'] * 5)
+        issues = DataProfiler(df=df).detect_format_issues()
+        assert issues['phone'] == []
+        assert issues['date'] == []
+    
+    def test_check_categorical_validity(self, profiler, sample_raw_data):
+        """Test statuses are compared case-insensitively and blanks are skipped."""
+        profiler.df = sample_raw_data.assign(account_status=['Active ', 'closed', 'suspended', '', None])
+        found, invalid = profiler.check_categorical_validity()['account_status']
+        assert invalid == [(3, 'closed')]
+        assert set(found) == {'Active ', 'closed', 'suspended', ''}
+    
+    def test_analyze_completeness(self, profiler, sample_raw_data):
+        """Test blank, whitespace-only and missing values count as incomplete."""
+        profiler.df = sample_raw_data.assign(address=['123 Main St', '  ', None, '', '892 Elm St'])
+        completeness = profiler.analyze_completeness()
+        assert completeness['address'] == pytest.approx(40.0)
+        assert completeness['customer_id'] == pytest.approx(100.0)
+    
+    def test_check_uniqueness(self, profiler, sample_raw_data):
+        """Test unique and duplicate counts ignore missing values."""
+        profiler.df = sample_raw_data.assign(email=['a@x.com', 'a@x.com', None, 'b@x.com', None])
+        uniqueness = profiler.check_uniqueness()
+        assert uniqueness['email'] == (2, 1)
+        assert uniqueness['customer_id'] == (5, 0)
+    
+    def test_profiler_requires_data_source(self):
+        """Test profiler needs either a DataFrame or a CSV path."""
+        with pytest.raises(ValueError):
+            DataProfiler()
+    
+    def test_generate_report_loads_csv_path(self, tmp_path, sample_raw_data):
+        """Test the CSV is only read when no DataFrame was given."""
+        csv_path = tmp_path / "customers_raw.csv"
+        sample_raw_data.to_csv(csv_path, index=False)
+        profiler = DataProfiler(csv_path=str(csv_path))
+        report = profiler.generate_report()
+        assert "Total Rows: 5" in report
+    
+    def test_check_value_ranges(self, profiler, sample_raw_data):
+        """Test income ranges skip unparseable values and count out-of-range ones."""
+        profiler.df = sample_raw_data.assign(income=['75000', '-10', 'abc', '', '20000000'])
+        ranges = profiler.check_value_ranges()
+        assert ranges['income'] == {'min': -10, 'max': 20_000_000, 'negative': 1, 'over_10m': 1}
+        assert ranges['customer_id']['invalid'] == 0
+    
+    def test_empty_dataframe(self, sample_raw_data):
+        """Test the report can be built for a frame with no rows."""
+        profiler = DataProfiler(df=sample_raw_data.head(0))
+        assert profiler.detect_format_issues()['phone'] == []
+        assert profiler.check_uniqueness()['email'] == (0, 0)
+        assert "Total Rows: 0" in profiler.generate_report()
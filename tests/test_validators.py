@@ -42,6 +42,127 @@ class TestDataValidator:
         assert result['total_rows'] == 3
 
 
+    def test_validate_with_details_reports_issues(self, sample_valid_data):
+        """Test each rule reports its issue and only failing rows carry their data."""
+        sample_valid_data.loc[0, 'customer_id'] = 'abc'
+        sample_valid_data.loc[1, 'email'] = 'not-an-email'
+        sample_valid_data.loc[2, 'account_status'] = 'closed'
+        result = DataValidator().validate_with_details(sample_valid_data, is_cleaned=False)
+        
+        assert result['passed_rows'] == 0
+        assert [item['issues'] for item in result['failed_rows']] == [
+            ["customer_id must be integer"],
+            ["Invalid email format: not-an-email"],
+            ["Invalid account_status: closed"],
+        ]
+        assert result['failed_rows'][1]['row_number'] == 3
+        assert result['failed_rows'][1]['data']['email'] == 'not-an-email'
+    
+    def test_validate_with_details_customer_id_rules(self, sample_valid_data):
+        """Test customer_id must parse as a positive integer, as text or integers."""
+        sample_valid_data['customer_id'] = [' 7 ', '-0', '1.5']
+        result = DataValidator().validate_with_details(sample_valid_data, is_cleaned=False)
+        assert [item['issues'] for item in result['failed_rows']] == [
+            ["customer_id must be positive"],
+            ["customer_id must be integer"],
+        ]
+        
+        sample_valid_data['customer_id'] = [3, 0, -2]
+        result = DataValidator().validate_with_details(sample_valid_data, is_cleaned=False)
+        assert [item['row_number'] for item in result['failed_rows']] == [3, 4]
+    
+    def test_validate_with_details_email_rules(self, sample_valid_data):
+        """Test empty domain labels and oversized local parts are rejected."""
+        sample_valid_data['email'] = ['john.doe@mail.example.com', 'jane@example..com', 'b' * 65 + '@example.com']
+        result = DataValidator().validate_with_details(sample_valid_data, is_cleaned=True)
+        
+        assert [item['row_number'] for item in result['failed_rows']] == [3, 4]
+    
+    def test_validate_with_details_phone_rules(self, sample_valid_data):
+        """Test raw data only needs ten digits while cleaned data needs XXX-XXX-XXXX."""
+        sample_valid_data.loc[0, 'phone'] = '(555) 123-4567'
+        sample_valid_data.loc[1, 'phone'] = '555-1234'
+        raw = DataValidator().validate_with_details(sample_valid_data, is_cleaned=False)
+        cleaned = DataValidator().validate_with_details(sample_valid_data, is_cleaned=True)
+        
+        assert [item['row_number'] for item in raw['failed_rows']] == [3]
+        assert [item['row_number'] for item in cleaned['failed_rows']] == [2, 3]
+    
+    def test_validate_with_details_cleaned_unicode_phone_digits(self, sample_valid_data):
+        """Test the cleaned phone format accepts any digits, as re's \\d does."""
+        sample_valid_data.loc[0, 'phone'] = '５５５-１２３-４５６７'
+        sample_valid_data.loc[1, 'phone'] = '٥٥٥-١٢٣-٤٥٦٧'
+        result = DataValidator().validate_with_details(sample_valid_data, is_cleaned=True)
+        
+        assert result['failed_rows'] == []
+    
+    def test_validate_with_details_counts_unicode_phone_digits(self, sample_valid_data):
+        """Test non-ASCII digits still count towards the raw ten-digit rule."""
+        sample_valid_data.loc[0, 'phone'] = '５５５-１２３-４５６７'
+        sample_valid_data.loc[1, 'phone'] = 'é 555-1234'
+        result = DataValidator().validate_with_details(sample_valid_data, is_cleaned=False)
+        
+        assert [item['row_number'] for item in result['failed_rows']] == [3]
+    
+    def test_validate_with_details_multi_chunk_phones(self, sample_valid_data):
+        """Test the raw phone rule handles Arrow columns split over several chunks."""
+        pa = pytest.importorskip("pyarrow")
+        second = sample_valid_data.copy()
+        sample_valid_data.loc[1, 'phone'] = '555-1234'
+        second.loc[1, 'phone'] = '５５５-１２３-４５６７'
+        df = pd.concat([sample_valid_data.astype('string[pyarrow]'), second.astype('string[pyarrow]')],
+                       ignore_index=True)
+        assert pa.array(df['phone'].array).num_chunks > 1
+        
+        result = DataValidator().validate_with_details(df, is_cleaned=False)
+        
+        assert [item['row_number'] for item in result['failed_rows']] == [3]
+    
+    def test_validate_with_details_polars_backend(self, sample_valid_data):
+        """Test the polars backend matches the pandas one."""
+        pl = pytest.importorskip("polars")
+        df = sample_valid_data.copy()
+        df.loc[0, 'customer_id'] = 'abc'
+        df.loc[1, 'email'] = 'bad-email'
+        df.loc[2, 'account_status'] = 'Unknown'
+        
+        for is_cleaned in (False, True):
+            expected = DataValidator().validate_with_details(df, is_cleaned=is_cleaned)
+            assert DataValidator(backend='polars').validate_with_details(df, is_cleaned=is_cleaned) == expected
+            assert DataValidator().validate_with_details(pl.from_pandas(df), is_cleaned=is_cleaned) == expected
+    
+    def test_polars_backend_edge_case_parity(self, sample_valid_data):
+        """Test both backends agree on float ids, Unicode digits and stray whitespace."""
+        pytest.importorskip("polars")
+        df = pd.concat([sample_valid_data] * 2, ignore_index=True)
+        df['phone'] = ['555-123-4567', '５５５-１２３-４５６７', '５５５１２３４５６７', '555-1234', '', None]
+        df['email'] = ['a@b.com', 'a@b.com\n', ' a@b.com', 'bad', None, 'x@y.org']
+        df['account_status'] = [' Active ', 'closed', '', None, 'SUSPENDED', 'inactive']
+        
+        for customer_ids in (['1', '-0', '１２', ' 7 ', 'x', None], [1.0, 0.0, 1.5, -2.0, 0.5, 3.0]):
+            df['customer_id'] = customer_ids
+            for is_cleaned in (False, True):
+                expected = DataValidator().validate_with_details(df, is_cleaned=is_cleaned)
+                actual = DataValidator(backend='polars').validate_with_details(df, is_cleaned=is_cleaned)
+                assert actual == expected
+    
+    def test_validate_raw_and_cleaned_columns(self, sample_valid_data):
+        """Test both schema checks require exactly the expected columns."""
+        validator = DataValidator()
+        assert validator.validate_raw(sample_valid_data)[0] is True
+        assert validator.validate_cleaned(sample_valid_data)[0] is True
+        
+        passed, failures = validator.validate_cleaned(sample_valid_data.drop(columns=['income']))
+        assert passed is False
+        assert failures['row_count'] == 3
+        assert 'Column mismatch' in failures['error']
+    
+    def test_invalid_backend(self):
+        """Test an unknown backend is rejected."""
+        with pytest.raises(ValueError):
+            DataValidator(backend='spark')
+
+
 class TestPIIDetector:
     """Tests for PIIDetector class."""
     
@@ -66,6 +187,7 @@ class TestPIIDetector:
         detector = PIIDetector()
         assert detector is not None
         assert detector.pii_patterns is not None
+        assert detector.pii_patterns['ssn'].search('SSN 123-45-6789')
     
     def test_detect_pii(self, sample_data):
         """Test PII detection."""
@@ -79,6 +201,37 @@ class TestPIIDetector:
         assert len(pii_data['emails']) == 2
         assert len(pii_data['phones']) == 2
     
+    def test_detect_pii_skips_missing_and_blank(self, sample_data):
+        """Test missing, empty and whitespace-only values are not reported as PII."""
+        sample_data.loc[0, 'email'] = None
+        sample_data.loc[1, 'address'] = '   '
+        sample_data.loc[1, 'phone'] = 'n/a'
+        pii_data = PIIDetector().detect_pii(sample_data)
+        
+        assert pii_data['emails'].tolist() == [(3, 'jane@example.com')]
+        assert pii_data['addresses'].tolist() == [(2, '123 Main St')]
+        assert pii_data['phones'].tolist() == [(2, '555-123-4567')]
+    
+    def test_detect_pii_unicode_digits(self, sample_data):
+        """Test phones and DOBs written with non-ASCII digits are still detected."""
+        sample_data.loc[0, 'phone'] = '٥٥٥١٢٣٤٥٦٧'
+        sample_data.loc[1, 'phone'] = '５５５-１２３-４５６７'
+        sample_data.loc[1, 'date_of_birth'] = '１９９０-０７-２２'
+        pii_data = PIIDetector().detect_pii(sample_data)
+        
+        assert pii_data['phones'].tolist() == [(2, '٥٥٥١٢٣٤٥٦٧'), (3, '５５５-１２３-４５６７')]
+        assert pii_data['dobs'].tolist() == [(2, '1985-03-15'), (3, '１９９０-０７-２２')]
+        assert len(pii_data['high_risk_rows']) == 2
+    
+    def test_detect_pii_high_risk_rows(self, sample_data):
+        """Test rows with three or more PII types are flagged with their types."""
+        sample_data.loc[1, ['email', 'phone', 'address']] = None
+        pii_data = PIIDetector().detect_pii(sample_data)
+        
+        assert pii_data['high_risk_rows'] == [
+            {'row': 2, 'pii_types': ['email', 'phone', 'address', 'dob', 'name'], 'pii_count': 5}
+        ]
+    
     def test_calculate_exposure_risk(self, sample_data):
         """Test risk calculation."""
         detector = PIIDetector()
@@ -88,3 +241,13 @@ class TestPIIDetector:
         assert 'email_coverage' in risk
         assert 'phone_coverage' in risk
         assert risk['email_coverage'] == 100.0
+    
+    def test_calculate_exposure_risk_empty(self, sample_data):
+        """Test an empty frame reports zero coverage instead of dividing by zero."""
+        detector = PIIDetector()
+        empty = sample_data.iloc[0:0]
+        risk = detector.calculate_exposure_risk(empty, detector.detect_pii(empty))
+        
+        assert risk['total_rows'] == 0
+        assert risk['email_coverage'] == 0.0
+        assert risk['risk_level'] == 'HIGH'